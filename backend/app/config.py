@@ -69,17 +69,37 @@ class Settings(BaseSettings):
         description="PostgreSQL database URL for async connections",
     )
     database_pool_size: int = Field(
-        default=10,
+        default=20,
         description="Database connection pool size",
     )
     database_max_overflow: int = Field(
-        default=20,
+        default=40,
         description="Maximum number of overflow connections",
     )
     database_pool_timeout: int = Field(
         default=30,
         description="Pool connection timeout in seconds",
     )
+    database_pool_recycle: int = Field(
+        default=3600,
+        description="Recycle pooled connections after this many seconds",
+    )
+    database_sync_pool_size: int = Field(
+        default=2,
+        description="Sync (Celery worker) connection pool size per worker process",
+    )
+    database_sync_max_overflow: int = Field(
+        default=2,
+        description="Sync (Celery worker) overflow connections per worker process",
+    )
+    database_statement_cache_size: int = Field(
+        default=1024,
+        description="asyncpg server-side prepared statement cache size per connection",
+    )
+    database_prepared_statement_cache_size: int = Field(
+        default=512,
+        description="SQLAlchemy asyncpg dialect prepared statement cache size per connection",
+    )
     database_echo: bool = Field(
         default=False,
         description="Echo SQL queries (useful for debugging)",
@@ -113,21 +133,29 @@ class Settings(BaseSettings):
         description="Celery result backend URL",
     )
     celery_task_serializer: str = Field(
-        default="json",
+        default="msgpack",
         description="Celery task serialization format",
     )
     celery_result_serializer: str = Field(
-        default="json",
+        default="msgpack",
         description="Celery result serialization format",
     )
     celery_accept_content: list[str] = Field(
-        default=["json"],
+        default=["msgpack", "json"],
         description="Accepted content types for Celery",
     )
+    celery_result_compression: str | None = Field(
+        default="zstd",
+        description="Compression for stored task results (None to disable)",
+    )
     celery_timezone: str = Field(
         default="UTC",
         description="Celery timezone",
     )
+    celery_worker_prefetch_multiplier: int = Field(
+        default=1,
+        description="Tasks prefetched per worker process (keep 1 for long indexing jobs)",
+    )
 
     # Qdrant Settings
     qdrant_host: str = Field(
@@ -150,6 +178,14 @@ class Settings(BaseSettings):
         default=False,
         description="Prefer gRPC over HTTP for Qdrant connections",
     )
+    qdrant_timeout: int = Field(
+        default=60,
+        description="Qdrant request timeout in seconds",
+    )
+    qdrant_pool_size: int = Field(
+        default=100,
+        description="Maximum pooled (keep-alive) HTTP connections to Qdrant",
+    )
 
     # Security Settings
     secret_key: str = Field(
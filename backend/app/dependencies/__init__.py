@@ -1,5 +1,6 @@
 """FastAPI dependency injection module."""
 
+from .cache import get_redis
 from .database import get_db
 
-__all__ = ["get_db"]
+__all__ = ["get_db", "get_redis"]
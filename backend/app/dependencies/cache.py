@@ -0,0 +1,29 @@
+"""Redis cache dependency for FastAPI."""
+
+from redis.asyncio import Redis
+
+from app.config import settings
+
+# Create shared Redis client (connections are opened lazily from its pool)
+redis_client: Redis = Redis.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_max_connections,
+    socket_timeout=settings.redis_socket_timeout,
+    socket_connect_timeout=settings.redis_socket_connect_timeout,
+    decode_responses=True,
+)
+
+
+async def get_redis() -> Redis:
+    """
+    FastAPI dependency that provides the shared Redis client.
+
+    Returns:
+        Redis: The application-wide async Redis client
+    """
+    return redis_client
+
+
+async def close_redis() -> None:
+    """Close Redis connection pool on shutdown."""
+    await redis_client.aclose()
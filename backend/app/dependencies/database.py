@@ -12,8 +12,13 @@ engine = create_async_engine(
     pool_size=settings.database_pool_size,
     max_overflow=settings.database_max_overflow,
     pool_timeout=settings.database_pool_timeout,
+    pool_recycle=settings.database_pool_recycle,
     echo=settings.database_echo,
     pool_pre_ping=True,
+    connect_args={
+        "statement_cache_size": settings.database_statement_cache_size,
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+    },
 )
 
 # Create session factory
@@ -10,10 +10,11 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from loguru import logger
 
 from app.config import settings
+from app.dependencies.cache import close_redis
 from app.dependencies.database import close_db, init_db
 
 
@@ -45,6 +46,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     await close_db()
     logger.info("Database connections closed")
 
+    # Close Redis connection pool
+    await close_redis()
+    logger.info("Redis connections closed")
+
 
 # Create FastAPI application instance
 app = FastAPI(
@@ -55,6 +60,7 @@ app = FastAPI(
     redoc_url="/redoc" if settings.enable_docs else None,
     openapi_url="/openapi.json" if settings.enable_docs else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS middleware
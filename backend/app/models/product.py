@@ -73,6 +73,9 @@ class Product(Base, TimestampMixin):
 
     # Vector embedding status
     embedding_updated_at: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    # Hash of the embedded text and payload last written to Qdrant (the copy in
+    # the point payload is the one compared against)
+    embedding_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
 
     # Relationships
     categories: Mapped[list["Category"]] = relationship(
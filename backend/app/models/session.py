@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import DateTime, Integer, String, Text, func
+from sqlalchemy import DateTime, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -58,6 +58,15 @@ class UserSession(Base, TimestampMixin):
         "AnalyticsEvent", back_populates="session", cascade="all, delete-orphan"
     )
 
+    # Partial index keeps expired-session cleanup an index range scan
+    __table_args__ = (
+        Index(
+            "ix_user_sessions_expires_at",
+            "expires_at",
+            postgresql_where=text("expires_at IS NOT NULL"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<UserSession(id={self.id}, session_id='{self.session_id[:8]}...')>"
 
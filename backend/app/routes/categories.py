@@ -1,8 +1,10 @@
 """Category API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.cache import get_redis
 from app.dependencies.database import get_db
 from app.schemas.category import (
     CategoryCreate,
@@ -12,6 +14,7 @@ from app.schemas.category import (
     CategoryWithProducts,
 )
 from app.schemas.product import ProductResponse
+from app.services.cache_service import CacheService
 from app.services.category_service import CategoryService
 
 router = APIRouter(prefix="/categories")
@@ -104,6 +107,7 @@ async def get_category(
 async def create_category(
     category_data: CategoryCreate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> CategoryResponse:
     """
     Create a new category.
@@ -121,6 +125,7 @@ async def create_category(
         )
 
     category = await service.create_category(category_data)
+    await CacheService(redis).invalidate(CacheService.FACETS_PREFIX)
     return CategoryResponse.model_validate(category)
 
 
@@ -129,6 +134,7 @@ async def update_category(
     slug: str,
     category_data: CategoryUpdate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> CategoryResponse:
     """
     Update an existing category.
@@ -145,6 +151,7 @@ async def update_category(
         )
 
     updated = await service.update_category(category.id, category_data)
+    await CacheService(redis).invalidate(CacheService.FACETS_PREFIX)
     return CategoryResponse.model_validate(updated)
 
 
@@ -152,6 +159,7 @@ async def update_category(
 async def delete_category(
     slug: str,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> None:
     """
     Delete a category (soft delete).
@@ -168,3 +176,4 @@ async def delete_category(
         )
 
     await service.delete_category(category.id)
+    await CacheService(redis).invalidate(CacheService.FACETS_PREFIX)
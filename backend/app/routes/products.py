@@ -1,8 +1,10 @@
 """Product API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.cache import get_redis
 from app.dependencies.database import get_db
 from app.schemas.product import (
     ProductCreate,
@@ -11,6 +13,7 @@ from app.schemas.product import (
     ProductResponse,
     ProductUpdate,
 )
+from app.services.cache_service import CacheService
 from app.services.product_service import ProductService
 
 router = APIRouter(prefix="/products")
@@ -57,11 +60,22 @@ async def list_products(
 async def get_featured_products(
     limit: int = Query(default=10, ge=1, le=50, description="Number of products"),
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> list[ProductResponse]:
     """Get featured products for homepage display."""
+    cache = CacheService(redis)
+    cache_key = CacheService.featured_key(limit)
+
+    cached = await cache.get_json(cache_key)
+    if cached is not None:
+        return [ProductResponse.model_validate(p) for p in cached]
+
     service = ProductService(db)
     products = await service.get_featured_products(limit=limit)
-    return [ProductResponse.model_validate(p) for p in products]
+    featured = [ProductResponse.model_validate(p) for p in products]
+
+    await cache.set_json(cache_key, [p.model_dump(mode="json") for p in featured])
+    return featured
 
 
 @router.get("/{sku}", response_model=ProductDetailResponse)
@@ -75,7 +89,7 @@ async def get_product(
     - **sku**: Product SKU (unique identifier)
     """
     service = ProductService(db)
-    product = await service.get_product_by_sku(sku)
+    product = await service.get_product_by_sku_with_categories(sku)
 
     if not product:
         raise HTTPException(
@@ -90,6 +104,7 @@ async def get_product(
 async def create_product(
     product_data: ProductCreate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> ProductResponse:
     """
     Create a new product.
@@ -107,6 +122,9 @@ async def create_product(
         )
 
     product = await service.create_product(product_data)
+    await CacheService(redis).invalidate(
+        CacheService.FEATURED_PREFIX, CacheService.FACETS_PREFIX
+    )
     return ProductResponse.model_validate(product)
 
 
@@ -115,6 +133,7 @@ async def update_product(
     sku: str,
     product_data: ProductUpdate,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> ProductResponse:
     """
     Update an existing product.
@@ -131,6 +150,9 @@ async def update_product(
         )
 
     updated = await service.update_product(product.id, product_data)
+    await CacheService(redis).invalidate(
+        CacheService.FEATURED_PREFIX, CacheService.FACETS_PREFIX
+    )
     return ProductResponse.model_validate(updated)
 
 
@@ -138,6 +160,7 @@ async def update_product(
 async def delete_product(
     sku: str,
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> None:
     """
     Delete a product (soft delete).
@@ -154,3 +177,6 @@ async def delete_product(
         )
 
     await service.delete_product(product.id)
+    await CacheService(redis).invalidate(
+        CacheService.FEATURED_PREFIX, CacheService.FACETS_PREFIX
+    )
@@ -1,8 +1,10 @@
 """Search API routes."""
 
 from fastapi import APIRouter, Depends, Query
+from redis.asyncio import Redis
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.dependencies.cache import get_redis
 from app.dependencies.database import get_db
 from app.schemas.product import ProductResponse
 from app.schemas.search import (
@@ -11,6 +13,7 @@ from app.schemas.search import (
     SearchSuggestion,
     SearchSuggestionsResponse,
 )
+from app.services.cache_service import CacheService
 from app.services.search_service import SearchService
 
 router = APIRouter(prefix="/search")
@@ -118,6 +121,7 @@ async def get_search_suggestions(
 async def get_search_filters(
     category_id: int | None = Query(default=None, description="Category context"),
     db: AsyncSession = Depends(get_db),
+    redis: Redis = Depends(get_redis),
 ) -> dict:
     """
     Get available search filters and facets.
@@ -126,13 +130,23 @@ async def get_search_filters(
 
     Returns available filters including price range and categories.
     """
+    cache = CacheService(redis)
+    cache_key = CacheService.facets_key(category_id)
+
+    cached = await cache.get_json(cache_key)
+    if cached is not None:
+        return cached
+
     service = SearchService(db)
     facets = await service.get_filter_facets(category_id=category_id)
 
-    return {
+    filters = {
         "price_range": facets.get("price_range"),
         "categories": [
             {"id": c.id, "name": c.name, "slug": c.slug}
             for c in facets.get("categories", [])
         ],
     }
+
+    await cache.set_json(cache_key, filters)
+    return filters
@@ -9,8 +9,9 @@ from .list_service import ListService
 from .search_service import SearchService
 from .session_service import SessionService
 from .analytics_service import AnalyticsService
+from .cache_service import CacheService
 from .embedding_service import EmbeddingService, get_embedding_service
-from .qdrant_service import QdrantService
+from .qdrant_service import QdrantService, get_qdrant_client
 
 __all__ = [
     "ProductService",
@@ -19,7 +20,9 @@ __all__ = [
     "SearchService",
     "SessionService",
     "AnalyticsService",
+    "CacheService",
     "EmbeddingService",
     "get_embedding_service",
     "QdrantService",
+    "get_qdrant_client",
 ]
@@ -0,0 +1,71 @@
+"""Cache service for short-lived Redis caching of read-heavy queries."""
+
+import json
+from typing import Any, Optional
+
+from loguru import logger
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+
+class CacheService:
+    """
+    Service for caching JSON-serializable query results in Redis.
+
+    Cache failures never fail the request: reads degrade to a miss and
+    writes/invalidations are logged and skipped.
+    """
+
+    FEATURED_PREFIX = "featured"
+    FACETS_PREFIX = "facets"
+
+    # Featured products and facets change rarely; keep entries briefly
+    DEFAULT_TTL_SECONDS = 60
+
+    def __init__(self, client: Redis) -> None:
+        """Initialize the cache service."""
+        self.client = client
+
+    @classmethod
+    def featured_key(cls, limit: int) -> str:
+        """Build the cache key for featured products."""
+        return f"{cls.FEATURED_PREFIX}:{limit}"
+
+    @classmethod
+    def facets_key(cls, category_id: Optional[int] = None) -> str:
+        """Build the cache key for search filter facets."""
+        return f"{cls.FACETS_PREFIX}:{'all' if category_id is None else category_id}"
+
+    async def get_json(self, key: str) -> Any | None:
+        """Get a cached value, or None on a miss or Redis error."""
+        try:
+            raw = await self.client.get(key)
+        except RedisError as e:
+            logger.warning(f"Cache read failed for {key}: {e}")
+            return None
+
+        if raw is None:
+            return None
+        return json.loads(raw)
+
+    async def set_json(
+        self, key: str, value: Any, ttl: int = DEFAULT_TTL_SECONDS
+    ) -> None:
+        """Cache a JSON-serializable value with an expiry."""
+        try:
+            await self.client.set(key, json.dumps(value), ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Cache write failed for {key}: {e}")
+
+    async def invalidate(self, *prefixes: str) -> None:
+        """Delete all cached entries under the given key prefixes."""
+        try:
+            keys = [
+                key
+                for prefix in prefixes
+                async for key in self.client.scan_iter(match=f"{prefix}:*")
+            ]
+            if keys:
+                await self.client.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Cache invalidation failed for {prefixes}: {e}")
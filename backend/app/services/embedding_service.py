@@ -21,6 +21,9 @@ class EmbeddingService:
     MODEL_NAME = "all-MiniLM-L6-v2"
     VECTOR_SIZE = 384
 
+    # Texts per model forward pass in batch_embeddings
+    ENCODE_BATCH_SIZE = 32
+
     def __init__(self) -> None:
         """Initialize the embedding service with the model."""
         self._model: SentenceTransformer | None = None
@@ -55,8 +58,13 @@ class EmbeddingService:
         Returns:
             List of 384-dimensional embedding vectors
         """
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
-        return [emb.tolist() for emb in embeddings]
+        if not texts:
+            return []
+
+        embeddings = self.model.encode(
+            texts, batch_size=self.ENCODE_BATCH_SIZE, convert_to_numpy=True
+        )
+        return embeddings.tolist()
 
     def get_product_text(
         self, product: ProductLike, category_names: list[str] | None = None
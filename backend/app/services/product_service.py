@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import func, insert, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -20,18 +20,27 @@ class ProductService:
     async def get_product_by_id(self, product_id: int) -> Optional[Product]:
         """Get product by ID."""
         result = await self.db.execute(
-            select(Product)
-            .options(selectinload(Product.categories))
-            .where(Product.id == product_id)
+            lambda_stmt(lambda: select(Product).where(Product.id == product_id))
         )
         return result.scalar_one_or_none()
 
     async def get_product_by_sku(self, sku: str) -> Optional[Product]:
         """Get product by SKU."""
+        result = await self.db.execute(
+            lambda_stmt(lambda: select(Product).where(Product.sku == sku))
+        )
+        return result.scalar_one_or_none()
+
+    async def get_product_by_sku_with_categories(self, sku: str) -> Optional[Product]:
+        """Get product by SKU with its categories eagerly loaded."""
+        return await self._get_with_categories(Product.sku == sku)
+
+    async def _get_with_categories(self, *criteria) -> Optional[Product]:
+        """Get a single product with categories loaded for detail responses."""
         result = await self.db.execute(
             select(Product)
             .options(selectinload(Product.categories))
-            .where(Product.sku == sku)
+            .where(*criteria)
         )
         return result.scalar_one_or_none()
 
@@ -86,11 +95,12 @@ class ProductService:
         self.db.add(product)
         await self.db.flush()
 
-        # Add category associations
+        # Add category associations in one executemany
         if category_ids:
-            for cat_id in category_ids:
-                assoc = ProductCategory(product_id=product.id, category_id=cat_id)
-                self.db.add(assoc)
+            await self.db.execute(
+                insert(ProductCategory),
+                [{"product_id": product.id, "category_id": cat_id} for cat_id in category_ids],
+            )
 
         await self.db.commit()
         await self.db.refresh(product)
@@ -120,9 +130,14 @@ class ProductService:
                 )
             )
             # Add new associations
-            for cat_id in category_ids:
-                assoc = ProductCategory(product_id=product_id, category_id=cat_id)
-                self.db.add(assoc)
+            if category_ids:
+                await self.db.execute(
+                    insert(ProductCategory),
+                    [
+                        {"product_id": product_id, "category_id": cat_id}
+                        for cat_id in category_ids
+                    ],
+                )
 
         await self.db.commit()
         await self.db.refresh(product)
@@ -141,9 +156,11 @@ class ProductService:
     async def get_featured_products(self, limit: int = 10) -> list[Product]:
         """Get featured products for homepage."""
         result = await self.db.execute(
-            select(Product)
-            .where(Product.is_active == True, Product.is_featured == True)
-            .limit(limit)
-            .order_by(Product.name)
+            lambda_stmt(
+                lambda: select(Product)
+                .where(Product.is_active == True, Product.is_featured == True)
+                .limit(limit)
+                .order_by(Product.name)
+            )
         )
         return list(result.scalars().all())
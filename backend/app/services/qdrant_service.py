@@ -1,10 +1,15 @@
 """Qdrant vector database service."""
 
 import hashlib
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Any
 
+import grpc
+import httpx
 from qdrant_client import QdrantClient
 from qdrant_client.http import models as qdrant_models
+from qdrant_client.http.exceptions import UnexpectedResponse
 
 from app.config import settings
 
@@ -14,6 +19,11 @@ class QdrantService:
 
     COLLECTION_NAME = "products"
     VECTOR_SIZE = 384
+    DISTANCE = qdrant_models.Distance.COSINE
+    QUANTIZATION_TYPE = qdrant_models.ScalarType.INT8
+
+    # Points per request when upserting in bulk
+    UPSERT_BATCH_SIZE = 256
 
     def __init__(self, client: QdrantClient | None = None) -> None:
         """
@@ -26,14 +36,9 @@ class QdrantService:
 
     @property
     def client(self) -> QdrantClient:
-        """Get or create Qdrant client."""
+        """Get the injected client or the shared process-wide client."""
         if self._client is None:
-            self._client = QdrantClient(
-                host=settings.qdrant_host,
-                port=settings.qdrant_port,
-                api_key=settings.qdrant_api_key,
-                prefer_grpc=settings.qdrant_prefer_grpc,
-            )
+            self._client = get_qdrant_client()
         return self._client
 
     def _sku_to_point_id(self, sku: str) -> str:
@@ -41,18 +46,47 @@ class QdrantService:
         hash_bytes = hashlib.md5(sku.encode()).hexdigest()
         return f"{hash_bytes[:8]}-{hash_bytes[8:12]}-{hash_bytes[12:16]}-{hash_bytes[16:20]}-{hash_bytes[20:32]}"
 
-    def ensure_collection(self) -> None:
-        """Create the products collection if it doesn't exist."""
+    @classmethod
+    def vector_config_signature(cls) -> str:
+        """Describe the collection's vector config, so config changes can be detected."""
+        return f"{cls.VECTOR_SIZE}:{cls.DISTANCE.value}:{cls.QUANTIZATION_TYPE.value}"
+
+    def ensure_collection(self) -> bool:
+        """
+        Create the products collection if it doesn't exist.
+
+        Concurrent workers may race to create the collection; the loser's
+        "already exists" error is swallowed.
+
+        Returns:
+            True if this call created the collection (which is therefore empty)
+        """
         if self.client.collection_exists(self.COLLECTION_NAME):
-            return
+            return False
 
-        self.client.create_collection(
-            collection_name=self.COLLECTION_NAME,
-            vectors_config=qdrant_models.VectorParams(
-                size=self.VECTOR_SIZE,
-                distance=qdrant_models.Distance.COSINE,
-            ),
-        )
+        try:
+            self.client.create_collection(
+                collection_name=self.COLLECTION_NAME,
+                vectors_config=qdrant_models.VectorParams(
+                    size=self.VECTOR_SIZE,
+                    distance=self.DISTANCE,
+                ),
+                # int8 copies of the vectors are kept in RAM for the HNSW search,
+                # a quarter of the float32 size; originals are used for rescoring
+                quantization_config=qdrant_models.ScalarQuantization(
+                    scalar=qdrant_models.ScalarQuantizationConfig(
+                        type=self.QUANTIZATION_TYPE,
+                        quantile=0.99,
+                        always_ram=True,
+                    ),
+                ),
+            )
+        except (UnexpectedResponse, grpc.RpcError):
+            # Another worker created it between the check and the create
+            if self.client.collection_exists(self.COLLECTION_NAME):
+                return False
+            raise
+        return True
 
     def upsert_product(
         self,
@@ -83,27 +117,44 @@ class QdrantService:
             ],
         )
 
-    def search(
+    def upsert_products_batch(
         self,
-        query_embedding: list[float],
-        limit: int = 20,
-        price_min: float | None = None,
-        price_max: float | None = None,
-        category_ids: list[int] | None = None,
-    ) -> list[tuple[str, float]]:
+        products: list[tuple[str, list[float], dict[str, Any]]],
+        batch_size: int = UPSERT_BATCH_SIZE,
+    ) -> None:
         """
-        Search for similar products.
+        Upsert many product vectors in chunked requests.
 
-        Args:
-            query_embedding: Query vector
-            limit: Maximum results to return
-            price_min: Optional minimum price filter
-            price_max: Optional maximum price filter
-            category_ids: Optional category filter
+        Only the final chunk waits for the write to be applied, so earlier
+        chunks are pipelined.
 
-        Returns:
-            List of (sku, score) tuples
+        Args:
+            products: (sku, embedding, payload) tuples
+            batch_size: Points per upsert request
         """
+        points = [
+            qdrant_models.PointStruct(
+                id=self._sku_to_point_id(sku),
+                vector=embedding,
+                payload={**payload, "sku": sku},
+            )
+            for sku, embedding, payload in products
+        ]
+
+        for start in range(0, len(points), batch_size):
+            self.client.upsert(
+                collection_name=self.COLLECTION_NAME,
+                points=points[start : start + batch_size],
+                wait=start + batch_size >= len(points),
+            )
+
+    def _build_filter(
+        self,
+        price_min: float | None = None,
+        price_max: float | None = None,
+        category_ids: list[int] | None = None,
+    ) -> qdrant_models.Filter | None:
+        """Build a payload filter from optional price and category constraints."""
         must_conditions = []
 
         if price_min is not None:
@@ -130,15 +181,36 @@ class QdrantService:
                 )
             )
 
-        query_filter = None
-        if must_conditions:
-            query_filter = qdrant_models.Filter(must=must_conditions)
+        if not must_conditions:
+            return None
+        return qdrant_models.Filter(must=must_conditions)
+
+    def search(
+        self,
+        query_embedding: list[float],
+        limit: int = 20,
+        price_min: float | None = None,
+        price_max: float | None = None,
+        category_ids: list[int] | None = None,
+    ) -> list[tuple[str, float]]:
+        """
+        Search for similar products.
+
+        Args:
+            query_embedding: Query vector
+            limit: Maximum results to return
+            price_min: Optional minimum price filter
+            price_max: Optional maximum price filter
+            category_ids: Optional category filter
 
+        Returns:
+            List of (sku, score) tuples
+        """
         results = self.client.search(
             collection_name=self.COLLECTION_NAME,
             query_vector=query_embedding,
             limit=limit,
-            query_filter=query_filter,
+            query_filter=self._build_filter(price_min, price_max, category_ids),
         )
 
         return [(hit.payload["sku"], hit.score) for hit in results]
@@ -157,6 +229,50 @@ class QdrantService:
             points_selector=qdrant_models.PointIdsList(points=[point_id]),
         )
 
+    def delete_products_batch(self, skus: Iterable[str]) -> None:
+        """
+        Delete many product vectors in a single request.
+
+        Args:
+            skus: Product SKUs to delete
+        """
+        point_ids = [self._sku_to_point_id(sku) for sku in skus]
+        if not point_ids:
+            return
+
+        self.client.delete(
+            collection_name=self.COLLECTION_NAME,
+            points_selector=qdrant_models.PointIdsList(points=point_ids),
+            wait=True,
+        )
+
+    def get_embedding_hashes(self, skus: Iterable[str]) -> dict[str, str]:
+        """
+        Get the content hashes stored with existing product vectors.
+
+        Args:
+            skus: Product SKUs to look up
+
+        Returns:
+            Mapping of SKU to stored embedding_hash; SKUs without a point
+            (or without a hash) are omitted
+        """
+        point_ids = [self._sku_to_point_id(sku) for sku in skus]
+        if not point_ids:
+            return {}
+
+        records = self.client.retrieve(
+            collection_name=self.COLLECTION_NAME,
+            ids=point_ids,
+            with_payload=["sku", "embedding_hash"],
+        )
+
+        return {
+            record.payload["sku"]: record.payload["embedding_hash"]
+            for record in records
+            if "sku" in record.payload and "embedding_hash" in record.payload
+        }
+
     def get_all_skus(self) -> set[str]:
         """Get all SKUs currently in the collection."""
         skus: set[str] = set()
@@ -178,3 +294,24 @@ class QdrantService:
                 break
 
         return skus
+
+
+@lru_cache(maxsize=1)
+def get_qdrant_client() -> QdrantClient:
+    """
+    Get cached Qdrant client instance.
+
+    One client per process keeps its HTTP connections (or gRPC channel)
+    alive across requests and tasks instead of reconnecting each time.
+    """
+    return QdrantClient(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        api_key=settings.qdrant_api_key,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        timeout=settings.qdrant_timeout,
+        limits=httpx.Limits(
+            max_connections=settings.qdrant_pool_size,
+            max_keepalive_connections=settings.qdrant_pool_size,
+        ),
+    )
@@ -5,10 +5,9 @@ from typing import Optional
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.config import settings
 from app.models import Category, Product, ProductCategory
 from app.services.embedding_service import get_embedding_service
-from app.services.qdrant_service import QdrantService
+from app.services.qdrant_service import QdrantService, get_qdrant_client
 
 
 class SearchService:
@@ -27,14 +26,7 @@ class SearchService:
         """Lazy initialization of Qdrant client."""
         if self._qdrant_client is None:
             try:
-                from qdrant_client import QdrantClient
-
-                self._qdrant_client = QdrantClient(
-                    host=settings.qdrant_host,
-                    port=settings.qdrant_port,
-                    api_key=settings.qdrant_api_key,
-                    prefer_grpc=settings.qdrant_prefer_grpc,
-                )
+                self._qdrant_client = get_qdrant_client()
             except Exception:
                 # Qdrant not available, will use keyword search fallback
                 self._qdrant_client = None
@@ -135,26 +127,11 @@ class SearchService:
         if not qdrant_results:
             return [], 0
 
-        # Extract SKUs and scores
-        sku_scores = {sku: score for sku, score in qdrant_results}
-        skus = list(sku_scores.keys())
-
         # Fetch products from database
-        products_query = select(Product).where(
-            Product.sku.in_(skus),
-            Product.is_active == True,
+        products_by_sku = await self._get_active_products_by_sku(
+            [sku for sku, _ in qdrant_results]
         )
-        result = await self.db.execute(products_query)
-        products = list(result.scalars().all())
-
-        # Create product-score pairs maintaining Qdrant order
-        scored_results = []
-        for product in products:
-            if product.sku in sku_scores:
-                scored_results.append((product, sku_scores[product.sku]))
-
-        # Sort by score descending
-        scored_results.sort(key=lambda x: x[1], reverse=True)
+        scored_results = self._score_products(qdrant_results, products_by_sku)
 
         # Apply pagination
         total = len(scored_results)
@@ -162,6 +139,32 @@ class SearchService:
 
         return paginated, total
 
+    async def _get_active_products_by_sku(self, skus: list[str]) -> dict[str, Product]:
+        """Load active products for the given SKUs, keyed by SKU."""
+        if not skus:
+            return {}
+
+        result = await self.db.execute(
+            select(Product).where(
+                Product.sku.in_(list(dict.fromkeys(skus))),
+                Product.is_active == True,
+            )
+        )
+        return {product.sku: product for product in result.scalars().all()}
+
+    @staticmethod
+    def _score_products(
+        sku_scores: list[tuple[str, float]], products_by_sku: dict[str, Product]
+    ) -> list[tuple[Product, float]]:
+        """Pair Qdrant hits with loaded products, sorted by score descending."""
+        scored_results = [
+            (products_by_sku[sku], score)
+            for sku, score in sku_scores
+            if sku in products_by_sku
+        ]
+        scored_results.sort(key=lambda x: x[1], reverse=True)
+        return scored_results
+
     async def _keyword_search(
         self,
         query: str,
@@ -4,8 +4,9 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, lambda_stmt, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models import UserSession
 
@@ -16,6 +17,9 @@ class SessionService:
     # Session expires after 7 days of inactivity
     SESSION_TIMEOUT_DAYS = 7
 
+    # Minimum interval between last_active_at writes for the same session
+    TOUCH_INTERVAL_SECONDS = 60
+
     def __init__(self, db: AsyncSession) -> None:
         """Initialize the session service."""
         self.db = db
@@ -23,7 +27,9 @@ class SessionService:
     async def get_session(self, session_id: str) -> Optional[UserSession]:
         """Get session by session_id string."""
         result = await self.db.execute(
-            select(UserSession).where(UserSession.session_id == session_id)
+            lambda_stmt(
+                lambda: select(UserSession).where(UserSession.session_id == session_id)
+            )
         )
         session = result.scalar_one_or_none()
 
@@ -35,7 +41,7 @@ class SessionService:
     async def get_session_by_db_id(self, db_id: int) -> Optional[UserSession]:
         """Get session by database ID."""
         result = await self.db.execute(
-            select(UserSession).where(UserSession.id == db_id)
+            lambda_stmt(lambda: select(UserSession).where(UserSession.id == db_id))
         )
         return result.scalar_one_or_none()
 
@@ -96,22 +102,52 @@ class SessionService:
         )
 
     async def touch_session(self, session: UserSession) -> None:
-        """Update the last_active_at timestamp."""
-        session.last_active_at = datetime.now(timezone.utc)
-        session.expires_at = datetime.now(timezone.utc) + timedelta(
-            days=self.SESSION_TIMEOUT_DAYS
+        """
+        Update the last_active_at timestamp.
+
+        Writes are throttled to once per TOUCH_INTERVAL_SECONDS per session:
+        the UPDATE only matches when the stored timestamp is older than the
+        interval, and the transaction is only committed if a row changed.
+        """
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(days=self.SESSION_TIMEOUT_DAYS)
+        result = await self.db.execute(
+            update(UserSession)
+            .where(
+                UserSession.id == session.id,
+                UserSession.last_active_at
+                < now - timedelta(seconds=self.TOUCH_INTERVAL_SECONDS),
+            )
+            .values(last_active_at=now, expires_at=expires_at)
+            .execution_options(synchronize_session=False)
         )
-        await self.db.commit()
+        if result.rowcount:
+            await self.db.commit()
+            # Mirror the write on the instance without marking it dirty
+            set_committed_value(session, "last_active_at", now)
+            set_committed_value(session, "expires_at", expires_at)
 
     async def delete_session(self, session_id: str) -> bool:
-        """Delete a session."""
-        session = await self.get_session(session_id)
-        if not session:
-            return False
+        """
+        Delete a session in a single DELETE ... RETURNING round-trip.
 
-        await self.db.delete(session)
+        Expired sessions are treated as missing, as in get_session, and left
+        for cleanup_expired_sessions. Lists and analytics events are removed
+        by the ON DELETE CASCADE foreign keys.
+        """
+        result = await self.db.execute(
+            delete(UserSession)
+            .where(
+                UserSession.session_id == session_id,
+                or_(
+                    UserSession.expires_at.is_(None),
+                    UserSession.expires_at > datetime.now(timezone.utc),
+                ),
+            )
+            .returning(UserSession.id)
+        )
         await self.db.commit()
-        return True
+        return result.scalar_one_or_none() is not None
 
     async def cleanup_expired_sessions(self) -> int:
         """
@@ -120,8 +156,6 @@ class SessionService:
         Returns:
             Number of sessions deleted
         """
-        from sqlalchemy import delete
-
         result = await self.db.execute(
             delete(UserSession).where(
                 UserSession.expires_at < datetime.now(timezone.utc)
@@ -1,9 +1,24 @@
 """Celery application configuration."""
 
+import logging
+
 from celery import Celery
+from celery.signals import worker_process_init
+from kombu import Queue
 
 from app.config import settings
 
+logger = logging.getLogger(__name__)
+
+# Short per-product embedding tasks run on their own queue so a dedicated worker
+# can prefetch more of them, while long sync/cleanup jobs go to "indexing".
+# A worker started without -Q consumes every queue declared in task_queues:
+#   celery -A app.worker.celery_app worker --loglevel=info
+# To split them, pass -Q, e.g. a second worker with -Q embeddings --prefetch-multiplier=4.
+DEFAULT_QUEUE = "celery"
+EMBEDDINGS_QUEUE = "embeddings"
+INDEXING_QUEUE = "indexing"
+
 celery_app = Celery(
     "retail_kiosk_worker",
     broker=settings.celery_broker_url,
@@ -16,11 +31,47 @@ celery_app.conf.update(
     task_serializer=settings.celery_task_serializer,
     result_serializer=settings.celery_result_serializer,
     accept_content=settings.celery_accept_content,
+    result_compression=settings.celery_result_compression,
     timezone=settings.celery_timezone,
     enable_utc=True,
     task_track_started=True,
     task_time_limit=300,  # 5 minutes max per task
-    worker_prefetch_multiplier=1,
+    task_default_queue=DEFAULT_QUEUE,
+    task_queues=(
+        Queue(DEFAULT_QUEUE),
+        Queue(EMBEDDINGS_QUEUE),
+        Queue(INDEXING_QUEUE),
+    ),
+    task_routes={
+        "app.worker.tasks.update_product_embeddings": {"queue": EMBEDDINGS_QUEUE},
+        "app.worker.tasks.update_product_embeddings_batch": {"queue": EMBEDDINGS_QUEUE},
+        "app.worker.tasks.sync_product_data": {"queue": INDEXING_QUEUE},
+        "app.worker.tasks.cleanup_stale_vectors": {"queue": INDEXING_QUEUE},
+    },
+    worker_prefetch_multiplier=settings.celery_worker_prefetch_multiplier,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+    # Child processes load the embedding model in worker_process_init; the 4s
+    # default kills children whose model cache is cold (first download)
+    worker_proc_alive_timeout=60,
 )
+
+
+@worker_process_init.connect
+def init_worker_process(**kwargs) -> None:
+    """
+    Warm per-process resources when a Celery worker process starts.
+
+    Loads the sentence-transformer model and builds the shared Qdrant client
+    so the first task in each process doesn't pay for them. This is
+    best-effort: failures are logged and left for the first task to retry,
+    and no network calls are made here (tasks call ensure_collection).
+    """
+    from app.services.embedding_service import get_embedding_service
+    from app.services.qdrant_service import get_qdrant_client
+
+    try:
+        get_embedding_service().model  # noqa: B018 - property triggers the model load
+        get_qdrant_client()
+    except Exception:
+        logger.warning("Worker warmup failed; resources load on first task", exc_info=True)
@@ -3,37 +3,65 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
+from datetime import datetime, timezone
+import hashlib
 import json
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session, sessionmaker
+import ijson
+from sqlalchemy import create_engine, delete, func, insert, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload, sessionmaker
 
 from app.config import settings
 from app.models import Category, Product, ProductCategory
-from app.services.embedding_service import get_embedding_service
+from app.services.embedding_service import EmbeddingService, get_embedding_service
 from app.services.qdrant_service import QdrantService
 from app.worker.celery_app import celery_app
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
-
-    from app.services.embedding_service import EmbeddingService
+    from collections.abc import Generator, Iterator, Sequence
 
 logger = logging.getLogger(__name__)
 
+# Products per INSERT ... ON CONFLICT statement (keeps bind params well under
+# PostgreSQL's 65535 limit)
+SYNC_BATCH_SIZE = 1000
+
+# Products per embedding batch: SKUs per queued update_product_embeddings_batch
+# task, and rows per partition when re-embedding the whole catalog
+EMBEDDING_BATCH_SIZE = 500
+
+# Mixed into every embedding hash so that changing the model or the vector
+# config invalidates all stored hashes and the next run re-embeds everything
+EMBEDDING_INDEX_SIGNATURE = (
+    f"{EmbeddingService.MODEL_NAME}:{QdrantService.vector_config_signature()}"
+)
+
 # Sync engine for Celery tasks (not async)
 _sync_engine = None
 _sync_session_factory = None
 
 
 def get_sync_engine():
-    """Get synchronous database engine."""
+    """
+    Get synchronous database engine.
+
+    The engine is a per-process singleton created on first use, so each
+    prefork Celery child builds its own pool after the fork. A child runs
+    one task at a time, which is why the sync pool is kept small.
+    """
     global _sync_engine  # noqa: PLW0603
     if _sync_engine is None:
-        _sync_engine = create_engine(settings.database_sync_url)
+        _sync_engine = create_engine(
+            settings.database_sync_url,
+            pool_size=settings.database_sync_pool_size,
+            max_overflow=settings.database_sync_max_overflow,
+            pool_pre_ping=True,
+            pool_recycle=settings.database_pool_recycle,
+        )
     return _sync_engine
 
 
@@ -41,7 +69,12 @@ def get_sync_session_factory():
     """Get synchronous session factory."""
     global _sync_session_factory  # noqa: PLW0603
     if _sync_session_factory is None:
-        _sync_session_factory = sessionmaker(bind=get_sync_engine())
+        # Tasks flush explicitly where needed; nothing is reused after commit
+        _sync_session_factory = sessionmaker(
+            bind=get_sync_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
     return _sync_session_factory
 
 
@@ -65,6 +98,114 @@ def _raise_file_not_found(file_path: str) -> None:
     raise FileNotFoundError(msg)
 
 
+def _iter_product_batches(
+    f: BinaryIO, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Stream products from a sync file in fixed-size batches.
+
+    The file is parsed incrementally, so memory stays proportional to
+    batch_size rather than the size of the feed. Within a batch, later
+    rows win when a SKU appears more than once.
+    """
+    batch: dict[str, dict[str, Any]] = {}
+    for product_data in ijson.items(f, "products.item", use_float=True):
+        batch[product_data["sku"]] = product_data
+        if len(batch) >= batch_size:
+            yield list(batch.values())
+            batch = {}
+
+    if batch:
+        yield list(batch.values())
+
+
+def _get_category_ids_by_slug(session: Session) -> dict[str, int]:
+    """
+    Load the slug to ID map for all categories in a single query.
+
+    The category tree is small compared to a product feed, so loading it
+    once up front is cheaper than resolving slugs batch by batch.
+    """
+    rows = session.execute(select(Category.slug, Category.id)).all()
+    return {slug: category_id for slug, category_id in rows}
+
+
+def _upsert_products(
+    session: Session, products_data: list[dict[str, Any]]
+) -> dict[str, int]:
+    """
+    Insert or update a batch of products with one INSERT ... ON CONFLICT.
+
+    Args:
+        session: Database session
+        products_data: Product dicts from the sync file (unique SKUs)
+
+    Returns:
+        Mapping of SKU to product ID for the upserted rows
+    """
+    product_rows = [
+        {
+            "sku": product_data["sku"],
+            "name": product_data["name"],
+            "description": product_data.get("description"),
+            "short_description": product_data.get("short_description"),
+            "price": product_data["price"],
+            "image_url": product_data.get("image_url"),
+            "attributes": product_data.get("attributes", {}),
+            "is_active": True,
+        }
+        for product_data in products_data
+    ]
+
+    stmt = pg_insert(Product).values(product_rows)
+    # Only overwrite columns the sync file provides; is_featured etc. are kept
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Product.sku],
+        set_={
+            **{
+                name: stmt.excluded[name]
+                for name in product_rows[0]
+                if name != "sku"
+            },
+            "updated_at": func.now(),
+        },
+    ).returning(Product.id, Product.sku)
+
+    return {sku: product_id for product_id, sku in session.execute(stmt).all()}
+
+
+def _replace_product_categories(
+    session: Session,
+    products_data: list[dict[str, Any]],
+    product_ids_by_sku: dict[str, int],
+    category_ids_by_slug: dict[str, int],
+) -> None:
+    """Replace category links for products whose sync data lists categories."""
+    product_ids = []
+    association_rows = []
+    for product_data in products_data:
+        category_slugs = product_data.get("categories", [])
+        product_id = product_ids_by_sku.get(product_data["sku"])
+        if not category_slugs or product_id is None:
+            continue
+
+        product_ids.append(product_id)
+        association_rows.extend(
+            {"product_id": product_id, "category_id": category_ids_by_slug[slug]}
+            for slug in dict.fromkeys(category_slugs)
+            if slug in category_ids_by_slug
+        )
+
+    if not product_ids:
+        return
+
+    session.execute(
+        delete(ProductCategory).where(ProductCategory.product_id.in_(product_ids))
+    )
+    if association_rows:
+        session.execute(insert(ProductCategory), association_rows)
+
+
 @celery_app.task(bind=True, max_retries=3)
 def sync_product_data(self, file_path: str) -> dict[str, Any]:
     """
@@ -82,64 +223,25 @@ def sync_product_data(self, file_path: str) -> dict[str, Any]:
         if not path.exists():
             _raise_file_not_found(file_path)
 
-        with path.open() as f:
-            data = json.load(f)
+        synced_skus: dict[str, None] = {}
 
-        products_data = data.get("products", [])
-        processed_skus = []
+        with path.open("rb") as f, get_sync_db_session() as session:
+            category_ids_by_slug = _get_category_ids_by_slug(session)
 
-        with get_sync_db_session() as session:
-            for product_data in products_data:
-                sku = product_data["sku"]
+            for batch in _iter_product_batches(f, SYNC_BATCH_SIZE):
+                product_ids_by_sku = _upsert_products(session, batch)
+                _replace_product_categories(
+                    session, batch, product_ids_by_sku, category_ids_by_slug
+                )
+                synced_skus.update(dict.fromkeys(p["sku"] for p in batch))
 
-                # Find or create product
-                product = session.execute(
-                    select(Product).where(Product.sku == sku)
-                ).scalar_one_or_none()
+        processed_skus = list(synced_skus)
 
-                if product is None:
-                    product = Product(sku=sku)
-                    session.add(product)
-
-                # Update product fields
-                product.name = product_data["name"]
-                product.description = product_data.get("description")
-                product.short_description = product_data.get("short_description")
-                product.price = product_data["price"]
-                product.image_url = product_data.get("image_url")
-                product.attributes = product_data.get("attributes", {})
-                product.is_active = True
-
-                # Handle categories
-                category_slugs = product_data.get("categories", [])
-                if category_slugs:
-                    # Clear existing categories
-                    if product.id:
-                        session.execute(
-                            ProductCategory.__table__.delete().where(
-                                ProductCategory.product_id == product.id
-                            )
-                        )
-
-                    session.flush()  # Get product ID
-
-                    for slug in category_slugs:
-                        category = session.execute(
-                            select(Category).where(Category.slug == slug)
-                        ).scalar_one_or_none()
-
-                        if category:
-                            pc = ProductCategory(
-                                product_id=product.id,
-                                category_id=category.id
-                            )
-                            session.add(pc)
-
-                processed_skus.append(sku)
-
-        # Queue embedding updates for all processed products
-        for sku in processed_skus:
-            update_product_embeddings.delay(sku)
+        # Queue embedding updates in SKU batches rather than one task per product
+        for start in range(0, len(processed_skus), EMBEDDING_BATCH_SIZE):
+            update_product_embeddings_batch.delay(
+                processed_skus[start : start + EMBEDDING_BATCH_SIZE]
+            )
 
         logger.info("Synced %d products from %s", len(processed_skus), file_path)
         return {"processed": len(processed_skus), "skus": processed_skus}
@@ -150,13 +252,20 @@ def sync_product_data(self, file_path: str) -> dict[str, Any]:
 
 
 @celery_app.task(bind=True, max_retries=3)
-def update_product_embeddings(self, sku: str | None = None) -> dict[str, Any]:
+def update_product_embeddings(
+    self, sku: str | None = None, force: bool = False
+) -> dict[str, Any]:
     """
     Update embeddings for one or all products.
 
+    Products whose content hash matches the one stored with their Qdrant
+    point are skipped unless force is set, so a wiped or recreated
+    collection is repopulated in full.
+
     Args:
         self: Celery task instance
         sku: Optional SKU to update (None = all products)
+        force: Re-embed products even if their content hash is unchanged
 
     Returns:
         Dict with status and updated SKU(s)
@@ -170,7 +279,11 @@ def update_product_embeddings(self, sku: str | None = None) -> dict[str, Any]:
             if sku:
                 # Single product update
                 product = session.execute(
-                    select(Product).where(Product.sku == sku)
+                    lambda_stmt(
+                        lambda: select(Product)
+                        .options(selectinload(Product.categories))
+                        .where(Product.sku == sku)
+                    )
                 ).scalar_one_or_none()
 
                 if not product:
@@ -182,16 +295,25 @@ def update_product_embeddings(self, sku: str | None = None) -> dict[str, Any]:
                 return {"sku": sku, "status": "updated"}
 
             # Update all products
+            # Stream products in fixed-size partitions; categories for each
+            # partition are loaded with one IN query
             products = session.execute(
-                select(Product).where(Product.is_active.is_(True))
-            ).scalars().all()
+                select(Product)
+                .options(selectinload(Product.categories))
+                .where(Product.is_active.is_(True))
+                .execution_options(yield_per=EMBEDDING_BATCH_SIZE)
+            ).scalars()
 
             updated = []
-            for product in products:
-                _update_single_product_embedding(
-                    product, embedding_service, qdrant_service
+            for batch in products.partitions():
+                updated.extend(
+                    _update_product_embeddings_bulk(
+                        batch, embedding_service, qdrant_service, force=force
+                    )
                 )
-                updated.append(product.sku)
+                # Write this partition's hashes now so clean rows can be
+                # released instead of piling up until commit
+                session.flush()
 
             return {"status": "updated_all", "count": len(updated), "skus": updated}
 
@@ -200,35 +322,148 @@ def update_product_embeddings(self, sku: str | None = None) -> dict[str, Any]:
         raise self.retry(exc=exc, countdown=30) from exc
 
 
+@celery_app.task(bind=True, max_retries=3)
+def update_product_embeddings_batch(
+    self, skus: list[str], force: bool = False
+) -> dict[str, Any]:
+    """
+    Update embeddings for a batch of products in one task.
+
+    Args:
+        self: Celery task instance
+        skus: SKUs to update
+        force: Re-embed products even if their content hash is unchanged
+
+    Returns:
+        Dict with status and updated SKUs
+    """
+    try:
+        embedding_service = get_embedding_service()
+        qdrant_service = QdrantService()
+        qdrant_service.ensure_collection()
+
+        with get_sync_db_session() as session:
+            products = session.execute(
+                select(Product)
+                .options(selectinload(Product.categories))
+                .where(Product.sku.in_(skus))
+            ).scalars().all()
+
+            updated = _update_product_embeddings_bulk(
+                products, embedding_service, qdrant_service, force=force
+            )
+
+            return {"status": "updated_batch", "count": len(updated), "skus": updated}
+
+    except Exception as exc:
+        logger.exception("Failed to update embeddings batch")
+        raise self.retry(exc=exc, countdown=30) from exc
+
+
+def _update_product_embeddings_bulk(
+    products: Sequence[Product],
+    embedding_service: EmbeddingService,
+    qdrant_service: QdrantService,
+    *,
+    force: bool = False,
+) -> list[str]:
+    """
+    Embed changed products in one model batch and upsert them in batched requests.
+
+    Products whose embedding text and payload hash matches the hash stored
+    in their Qdrant point are skipped unless force is set. Comparing against
+    Qdrant rather than products.embedding_hash means points lost to a wiped
+    or recreated collection are always rebuilt.
+
+    Returns:
+        SKUs that were re-embedded
+    """
+    stored_hashes = {} if force else qdrant_service.get_embedding_hashes(p.sku for p in products)
+
+    changed = []
+    texts = []
+    payloads = []
+    hashes = []
+    for product in products:
+        category_names, payload = _product_embedding_payload(product)
+        text = embedding_service.get_product_text(product, category_names=category_names)
+        content_hash = _embedding_hash(text, payload)
+        if stored_hashes.get(product.sku) == content_hash:
+            continue
+
+        changed.append(product)
+        texts.append(text)
+        payloads.append(payload)
+        hashes.append(content_hash)
+
+    if not changed:
+        return []
+
+    # One batched model pass instead of one forward pass per product
+    embeddings = embedding_service.batch_embeddings(texts)
+
+    skus = [product.sku for product in changed]
+    qdrant_service.upsert_products_batch(
+        [
+            (sku, embedding, {**payload, "embedding_hash": content_hash})
+            for sku, embedding, payload, content_hash in zip(skus, embeddings, payloads, hashes)
+        ]
+    )
+
+    # Flushed together with the surrounding session's commit
+    updated_at = datetime.now(timezone.utc).isoformat()
+    for product, content_hash in zip(changed, hashes):
+        product.embedding_hash = content_hash
+        product.embedding_updated_at = updated_at
+
+    return skus
+
+
+def _embedding_hash(text: str, payload: dict[str, Any]) -> str:
+    """Hash the embedding text and Qdrant payload of a product, plus the index config."""
+    content = "\0".join(
+        [EMBEDDING_INDEX_SIGNATURE, text, json.dumps(payload, sort_keys=True)]
+    )
+    return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+
+def _product_embedding_payload(product: Product) -> tuple[list[str], dict[str, Any]]:
+    """Get category names and the Qdrant payload for a product."""
+    # product.categories returns Category objects directly
+    # (many-to-many relationship using secondary table)
+    category_names = [c.name for c in product.categories]
+    payload = {
+        "name": product.name,
+        "price": float(product.price) if product.price else 0.0,
+        "category_ids": [c.id for c in product.categories],
+    }
+    return category_names, payload
+
+
 def _update_single_product_embedding(
     product: Product,
     embedding_service: EmbeddingService,
     qdrant_service: QdrantService,
 ) -> None:
     """Update embedding for a single product."""
-    # Get category names - product.categories returns Category objects directly
-    # (many-to-many relationship using secondary table)
-    category_names = [c.name for c in product.categories]
+    category_names, payload = _product_embedding_payload(product)
 
     # Generate text and embedding
     text = embedding_service.get_product_text(product, category_names=category_names)
     embedding = embedding_service.generate_embedding(text)
 
-    # Prepare payload - get category IDs from Category objects
-    category_ids = [c.id for c in product.categories]
-    payload = {
-        "name": product.name,
-        "price": float(product.price) if product.price else 0.0,
-        "category_ids": category_ids,
-    }
+    content_hash = _embedding_hash(text, payload)
 
     # Upsert to Qdrant
     qdrant_service.upsert_product(
         sku=product.sku,
         embedding=embedding,
-        payload=payload,
+        payload={**payload, "embedding_hash": content_hash},
     )
 
+    product.embedding_hash = content_hash
+    product.embedding_updated_at = datetime.now(timezone.utc).isoformat()
+
 
 @celery_app.task(bind=True)
 def cleanup_stale_vectors(self) -> dict[str, Any]:  # noqa: ARG001
@@ -257,8 +492,7 @@ def cleanup_stale_vectors(self) -> dict[str, Any]:  # noqa: ARG001
             stale_skus = qdrant_skus - db_skus
 
             # Delete stale vectors
-            for sku in stale_skus:
-                qdrant_service.delete_product(sku)
+            qdrant_service.delete_products_batch(stale_skus)
 
             logger.info("Cleaned up %d stale vectors", len(stale_skus))
             return {"deleted": len(stale_skus), "deleted_skus": list(stale_skus)}
@@ -7,7 +7,7 @@ from pathlib import Path
 # Add the backend directory to the path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.config import settings
@@ -160,48 +160,75 @@ async def seed_database():
             return
 
         print("Seeding categories...")
-        category_map = {}  # slug -> category
-
-        for cat_data in CATEGORIES:
-            children = cat_data.pop("children", [])
-
-            # Create parent category
-            parent = Category(**cat_data, is_active=True)
-            session.add(parent)
-            await session.flush()
-            category_map[parent.slug] = parent
-            print(f"  Created category: {parent.name}")
-
-            # Create child categories
-            for child_data in children:
-                child = Category(**child_data, parent_id=parent.id, is_active=True, display_order=0)
-                session.add(child)
-                await session.flush()
-                category_map[child.slug] = child
-                print(f"    Created subcategory: {child.name}")
+        # One INSERT ... RETURNING per level instead of a flush per row
+        parent_rows = [
+            {key: value for key, value in cat_data.items() if key != "children"}
+            | {"is_active": True}
+            for cat_data in CATEGORIES
+        ]
+        result = await session.execute(
+            insert(Category).returning(
+                Category.id, Category.slug, Category.name, sort_by_parameter_order=True
+            ),
+            parent_rows,
+        )
+        category_ids = {}  # slug -> category id
+        for category_id, slug, name in result:
+            category_ids[slug] = category_id
+            print(f"  Created category: {name}")
+
+        child_rows = [
+            child_data
+            | {"parent_id": category_ids[cat_data["slug"]], "is_active": True, "display_order": 0}
+            for cat_data in CATEGORIES
+            for child_data in cat_data.get("children", [])
+        ]
+        result = await session.execute(
+            insert(Category).returning(
+                Category.id, Category.slug, Category.name, sort_by_parameter_order=True
+            ),
+            child_rows,
+        )
+        for category_id, slug, name in result:
+            category_ids[slug] = category_id
+            print(f"    Created subcategory: {name}")
 
         print("\nSeeding products...")
-        for prod_data in PRODUCTS:
-            categories = prod_data.pop("categories", [])
-
-            # Create product
-            product = Product(**prod_data, is_active=True)
-            session.add(product)
-            await session.flush()
-            print(f"  Created product: {product.name}")
-
-            # Add category associations
-            for cat_slug in categories:
-                if cat_slug in category_map:
-                    assoc = ProductCategory(
-                        product_id=product.id,
-                        category_id=category_map[cat_slug].id
-                    )
-                    session.add(assoc)
+        product_rows = [
+            {key: value for key, value in prod_data.items() if key != "categories"}
+            | {"is_active": True}
+            for prod_data in PRODUCTS
+        ]
+        result = await session.execute(
+            insert(Product).returning(
+                Product.id, Product.sku, Product.name, sort_by_parameter_order=True
+            ),
+            product_rows,
+        )
+        product_ids = {}  # sku -> product id
+        for product_id, sku, name in result:
+            product_ids[sku] = product_id
+            print(f"  Created product: {name}")
+
+        # Add category associations
+        association_rows = [
+            {"product_id": product_ids[prod_data["sku"]], "category_id": category_ids[cat_slug]}
+            for prod_data in PRODUCTS
+            for cat_slug in prod_data.get("categories", [])
+            if cat_slug in category_ids
+        ]
+        if association_rows:
+            await session.execute(insert(ProductCategory), association_rows)
 
         await session.commit()
         print("\nSeed completed successfully!")
 
 
 if __name__ == "__main__":
-    asyncio.run(seed_database())
+    try:
+        # uvloop ships with uvicorn[standard] but is unavailable on Windows
+        import uvloop
+    except ImportError:
+        asyncio.run(seed_database())
+    else:
+        uvloop.run(seed_database())
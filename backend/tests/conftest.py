@@ -5,25 +5,66 @@ and sample data that can be used across all test modules.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator, Generator
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, TypeVar
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy import event
+from sqlalchemy.engine import make_url
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.dialects.sqlite import JSON as SQLiteJSON
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.pool import StaticPool
 
+try:
+    # uvloop ships with uvicorn[standard] but is unavailable on Windows
+    import uvloop
+except ImportError:
+    uvloop = None
+
+from app.dependencies.cache import get_redis
 from app.dependencies.database import get_db
 from app.main import app
-from app.models import Base
+from app.models import Base, Category
+from app.services.embedding_service import EmbeddingService
+from tests.factories import (
+    SeededCatalog,
+    SeededList,
+    create_categories_in_db,
+    create_category,
+    seed_catalog_in_db,
+    seed_list_in_db,
+)
+
+# Use SQLite in-memory for tests - lightweight and isolated. Point
+# TEST_DATABASE_URL at a disposable Postgres database to run against Postgres.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+
+# Under pytest-xdist each worker is its own process, so in-memory SQLite is
+# already private to it. A shared server database gets a per-worker database
+# name instead (e.g. kiosk_test_gw0), which must exist before the run.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+if _XDIST_WORKER and not TEST_DATABASE_URL.startswith("sqlite"):
+    _url = make_url(TEST_DATABASE_URL)
+    TEST_DATABASE_URL = _url.set(database=f"{_url.database}_{_XDIST_WORKER}").render_as_string(
+        hide_password=False
+    )
+
 
-# Use SQLite in-memory for tests - lightweight and isolated
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+T = TypeVar("T")
+
+# Shared fake embedding vector, built once rather than per test
+MOCK_EMBEDDING: list[float] = [0.1] * 384
 
 
 # Compile JSONB as JSON for SQLite dialect
@@ -40,37 +81,56 @@ def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
 
     This allows async fixtures and tests to use the same event loop
     throughout the test session, which is required for session-scoped
-    async fixtures.
+    async fixtures. Uses uvloop when it is installed.
 
     Yields:
         asyncio.AbstractEventLoop: The event loop for the test session
     """
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+    if uvloop is not None:
+        loop = uvloop.new_event_loop()
+    else:
+        loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def db_engine():
-    """Create a function-scoped async engine with fresh tables.
+    """Create a session-scoped async engine with the schema created once.
 
-    Creates and drops all tables for each test to ensure isolation.
+    Tests are isolated by rolling back an outer transaction per test (see
+    db_session) rather than recreating the tables.
 
     Yields:
         AsyncEngine: The SQLAlchemy async engine for tests
     """
-    engine = create_async_engine(
-        TEST_DATABASE_URL,
-        echo=False,
-        connect_args={"check_same_thread": False},
-    )
-
-    # Enable SQLite foreign key support
-    @event.listens_for(engine.sync_engine, "connect")
-    def set_sqlite_pragma(dbapi_connection, connection_record):
-        cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA foreign_keys=ON")
-        cursor.close()
+    if not TEST_DATABASE_URL.startswith("sqlite"):
+        engine = create_async_engine(TEST_DATABASE_URL, echo=False)
+    else:
+        engine = create_async_engine(
+            TEST_DATABASE_URL,
+            echo=False,
+            # One shared in-memory database for every connection
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def set_sqlite_pragma(dbapi_connection, connection_record):
+            # Enable SQLite foreign key support
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA foreign_keys=ON")
+            # Nothing needs to survive the process, so skip journaling and syncs
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
+            # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine.sync_engine, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN")
 
     # Create all tables
     async with engine.begin() as conn:
@@ -78,51 +138,233 @@ async def db_engine():
 
     yield engine
 
-    # Drop all tables after test
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    if not TEST_DATABASE_URL.startswith("sqlite"):
+        # Leave a server database empty so the next run builds the current schema
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
 
     await engine.dispose()
 
 
+@pytest.fixture(scope="session")
+async def db_connection(db_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open one connection for the test session inside an outer transaction.
+
+    Each test (and each seeded fixture) works inside its own SAVEPOINT on
+    this connection, and the outer transaction is rolled back at the end.
+
+    Args:
+        db_engine: The async database engine fixture
+
+    Yields:
+        AsyncConnection: The shared database connection
+    """
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await trans.rollback()
+
+
 @pytest.fixture
-async def db_session(db_engine) -> AsyncGenerator[AsyncSession, None]:
+async def db_session(db_connection: AsyncConnection) -> AsyncGenerator[AsyncSession, None]:
     """Create a function-scoped async session for database operations.
 
-    This fixture provides an isolated database session for each test,
-    ensuring that tests don't interfere with each other.
+    The session runs inside a SAVEPOINT that is rolled back after the test.
+    Commits made by the code under test only release an inner SAVEPOINT, so
+    nothing persists between tests and teardown is that single rollback
+    rather than per-table DELETE or TRUNCATE statements.
 
     Args:
-        db_engine: The async database engine fixture
+        db_connection: The shared database connection fixture
 
     Yields:
         AsyncSession: An async database session for the test
     """
+    savepoint = await db_connection.begin_nested()
+
     async_session_maker = async_sessionmaker(
-        db_engine,
+        bind=db_connection,
         class_=AsyncSession,
         expire_on_commit=False,
         autocommit=False,
         autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
 
     async with async_session_maker() as session:
         try:
             yield session
         finally:
-            await session.rollback()
             await session.close()
+            await savepoint.rollback()
 
 
 @pytest.fixture
-async def test_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async HTTP test client with database dependency override.
+def query_counter(db_engine) -> Generator[list[str], None, None]:
+    """Record every SQL statement sent to the database during the test.
 
-    This fixture overrides the database dependency to use the test session,
-    allowing API tests to use the isolated test database.
+    Clear the list after arranging data, then assert on its length to catch
+    lazy loads and other N+1 query patterns.
 
     Args:
+        db_engine: The async database engine fixture
+
+    Yields:
+        list[str]: The executed statements, in order
+    """
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(db_engine.sync_engine, "before_cursor_execute", record)
+
+
+def _seed_in_savepoint(
+    event_loop: asyncio.AbstractEventLoop,
+    conn: AsyncConnection,
+    seed: Callable[[AsyncSession], Awaitable[T]],
+) -> Generator[T, None, None]:
+    """Run seed in a SAVEPOINT that is rolled back when the generator closes.
+
+    Class-scoped seed fixtures are sync and drive the session loop because
+    pytest-asyncio 0.23 cannot share one loop with class-scoped async fixtures.
+    """
+
+    async def run() -> T:
+        async with AsyncSession(
+            bind=conn, expire_on_commit=False, join_transaction_mode="create_savepoint"
+        ) as session:
+            result = await seed(session)
+            await session.commit()
+        return result
+
+    savepoint = event_loop.run_until_complete(conn.begin_nested())
+    try:
+        yield event_loop.run_until_complete(run())
+    finally:
+        event_loop.run_until_complete(savepoint.rollback())
+
+
+async def _seed_categories(session: AsyncSession) -> dict[str, Category]:
+    """Insert the shared category graph in a single flush."""
+    tools = create_category(name="Tools", slug="tools", display_order=1)
+    power_tools = create_category(name="Power Tools", slug="power-tools", parent=tools)
+
+    categories = await create_categories_in_db(
+        session,
+        [
+            {"name": "Hardware", "slug": "hardware", "display_order": 2},
+            {"name": "Paint", "slug": "paint", "display_order": 3},
+            {"name": "Clearance", "slug": "clearance", "display_order": 4, "is_active": False},
+            {"name": "Cordless Drills", "slug": "cordless-drills", "parent": power_tools},
+            {"name": "Retired Tools", "slug": "retired-tools", "parent": tools, "is_active": False},
+        ],
+    )
+    return {c.slug: c for c in [tools, power_tools, *categories]}
+
+
+@pytest.fixture(scope="class")
+def seeded_categories(
+    event_loop: asyncio.AbstractEventLoop, db_connection: AsyncConnection
+) -> Generator[dict[str, Category], None, None]:
+    """Seed a shared category graph once for a class of read-only tests.
+
+    The graph lives in a SAVEPOINT that is rolled back after the class, so
+    tests that arrange their own data never see it:
+
+        tools (1) -> power-tools -> cordless-drills
+                  -> retired-tools (inactive)
+        hardware (2)
+        paint (3)
+        clearance (4, inactive)
+
+    Args:
+        event_loop: The session-scoped event loop fixture
+        db_connection: The shared database connection fixture
+
+    Yields:
+        dict[str, Category]: The seeded categories keyed by slug
+    """
+    yield from _seed_in_savepoint(event_loop, db_connection, _seed_categories)
+
+
+@pytest.fixture(scope="class")
+def seeded_catalog(
+    event_loop: asyncio.AbstractEventLoop, db_connection: AsyncConnection
+) -> Generator[SeededCatalog, None, None]:
+    """Seed a canonical product catalog once for a class of read-only tests.
+
+    See seed_catalog_in_db for the rows inserted. The catalog is rolled back
+    after the class.
+
+    Args:
+        event_loop: The session-scoped event loop fixture
+        db_connection: The shared database connection fixture
+
+    Yields:
+        SeededCatalog: The seeded products and categories
+    """
+    yield from _seed_in_savepoint(event_loop, db_connection, seed_catalog_in_db)
+
+
+@pytest.fixture(scope="class")
+def seeded_list(
+    event_loop: asyncio.AbstractEventLoop, db_connection: AsyncConnection
+) -> Generator[SeededList, None, None]:
+    """Seed a session, an empty list and a product once per test class.
+
+    Tests may mutate these rows freely: each test's changes are rolled back
+    with its own db_session SAVEPOINT, and the seed itself is rolled back
+    after the class.
+
+    Args:
+        event_loop: The session-scoped event loop fixture
+        db_connection: The shared database connection fixture
+
+    Yields:
+        SeededList: The seeded session, list and product
+    """
+    yield from _seed_in_savepoint(event_loop, db_connection, seed_list_in_db)
+
+
+@pytest.fixture(scope="session")
+async def asgi_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one in-process HTTP client for the whole test session.
+
+    Requests are dispatched through ASGITransport, so no socket is opened.
+    Use test_client in tests; it adds the per-test dependency overrides.
+
+    Yields:
+        AsyncClient: An httpx AsyncClient bound to the app
+    """
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture
+async def test_client(
+    asgi_client: AsyncClient, db_session: AsyncSession, mock_redis_client: MagicMock
+) -> AsyncGenerator[AsyncClient, None]:
+    """Provide the shared HTTP test client with per-test dependency overrides.
+
+    This fixture overrides the database and Redis dependencies so API tests
+    use the isolated test database and an always-missing cache. Cookies set
+    by earlier tests are cleared first so no session state leaks between tests.
+    Every request shares the test's AsyncSession, so await requests one at a
+    time; an AsyncSession does not support concurrent use via asyncio.gather.
+
+    Args:
+        asgi_client: The session-scoped HTTP client fixture
         db_session: The async database session fixture
+        mock_redis_client: The mocked Redis client fixture
 
     Yields:
         AsyncClient: An httpx AsyncClient configured for testing
@@ -134,10 +376,10 @@ async def test_client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, N
 
     # Override the database dependency
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_redis] = lambda: mock_redis_client
 
-    transport = ASGITransport(app=app)
-    async with AsyncClient(transport=transport, base_url="http://test") as client:
-        yield client
+    asgi_client.cookies.clear()
+    yield asgi_client
 
     # Clean up dependency overrides
     app.dependency_overrides.clear()
@@ -233,6 +475,24 @@ def sample_analytics_event_data() -> dict[str, Any]:
     }
 
 
+# ============================================================================
+# Real Service Fixtures
+# ============================================================================
+
+
+@pytest.fixture(scope="session")
+def embedding_service() -> EmbeddingService:
+    """Provide a real embedding service shared across the test session.
+
+    The sentence-transformers model loads lazily on first use and is then
+    reused by every test that requests this fixture.
+
+    Returns:
+        EmbeddingService: The shared embedding service
+    """
+    return EmbeddingService()
+
+
 # ============================================================================
 # Mock Fixtures for External Services
 # ============================================================================
@@ -260,8 +520,10 @@ def mock_embedding_service() -> MagicMock:
         MagicMock: A mocked embedding service
     """
     mock = MagicMock()
-    mock.generate_embedding = MagicMock(return_value=[0.1] * 384)
-    mock.batch_embeddings = MagicMock(return_value=[[0.1] * 384, [0.2] * 384])
+    mock.generate_embedding = MagicMock(return_value=MOCK_EMBEDDING)
+    mock.batch_embeddings = MagicMock(
+        side_effect=lambda texts: [MOCK_EMBEDDING] * len(texts)
+    )
     return mock
 
 
@@ -277,4 +539,10 @@ def mock_redis_client() -> MagicMock:
     mock.set = AsyncMock(return_value=True)
     mock.delete = AsyncMock(return_value=1)
     mock.exists = AsyncMock(return_value=0)
+
+    async def scan_iter(*args: Any, **kwargs: Any) -> AsyncGenerator[str, None]:
+        for key in ():
+            yield key
+
+    mock.scan_iter = MagicMock(side_effect=scan_iter)
     return mock
@@ -5,15 +5,75 @@ sensible defaults. Each factory function accepts **kwargs to override
 any default values.
 """
 
-import uuid
+import itertools
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Final, NamedTuple
+
+from sqlalchemy import insert
 
 from app.models.analytics import AnalyticsEvent, EventType
 from app.models.list import ListItem, UserList
 from app.models.product import Category, Product, ProductCategory
 from app.models.session import UserSession
 
+# Unique suffixes only need to be unique within a test run, so a counter
+# replaces random UUIDs and avoids reading os.urandom on every factory call
+_sequence = itertools.count(1)
+
+
+def _next_token() -> str:
+    """Return the next unique 8-character hex token."""
+    return f"{next(_sequence):08x}"
+
+
+# Immutable defaults are built once; unique and mutable fields are added per call
+_PRODUCT_DEFAULTS: Final[dict[str, Any]] = {
+    "name": "Test Product",
+    "description": "A test product for unit testing purposes",
+    "short_description": "Test product",
+    "price": 19.99,
+    "image_url": "https://example.com/images/product.jpg",
+    "thumbnail_url": "https://example.com/images/product-thumb.jpg",
+    "is_active": True,
+    "is_featured": False,
+    "embedding_updated_at": None,
+    "embedding_hash": None,
+}
+
+_CATEGORY_DEFAULTS: Final[dict[str, Any]] = {
+    "name": "Test Category",
+    "description": "A test category for unit testing",
+    "image_url": "https://example.com/images/category.jpg",
+    "display_order": 0,
+    "is_active": True,
+    "parent_id": None,
+}
+
+_SESSION_DEFAULTS: Final[dict[str, Any]] = {
+    "device_type": "kiosk",
+    "user_agent": "TestBrowser/1.0",
+    "ip_address": "192.168.1.100",
+    "expires_at": None,
+}
+
+_USER_LIST_DEFAULTS: Final[dict[str, Any]] = {
+    "name": "My Shopping List",
+    "description": "A test shopping list",
+    "share_code": None,
+}
+
+_LIST_ITEM_DEFAULTS: Final[dict[str, Any]] = {
+    "quantity": 1,
+    "notes": None,
+    "price_at_add": None,
+}
+
+_ANALYTICS_EVENT_DEFAULTS: Final[dict[str, Any]] = {
+    "event_type": EventType.VIEW_PRODUCT.value,
+    "product_sku": None,
+    "search_query": None,
+}
+
 
 def create_product(**kwargs: Any) -> Product:
     """Create a Product model instance with sensible defaults.
@@ -32,21 +92,14 @@ def create_product(**kwargs: Any) -> Product:
         29.99
     """
     defaults: dict[str, Any] = {
-        "sku": f"SKU-{uuid.uuid4().hex[:8].upper()}",
-        "name": "Test Product",
-        "description": "A test product for unit testing purposes",
-        "short_description": "Test product",
-        "price": 19.99,
-        "image_url": "https://example.com/images/product.jpg",
-        "thumbnail_url": "https://example.com/images/product-thumb.jpg",
+        **_PRODUCT_DEFAULTS,
         "attributes": {"material": "steel", "color": "silver"},
         "specifications": {"weight": "100g", "dimensions": "10x5x3cm"},
-        "is_active": True,
-        "is_featured": False,
-        "embedding_updated_at": None,
     }
-    defaults.update(kwargs)
-    return Product(**defaults)
+    # Most tests pin the SKU, so only draw a unique one when it is missing
+    if "sku" not in kwargs:
+        defaults["sku"] = f"SKU-{_next_token().upper()}"
+    return Product(**{**defaults, **kwargs})
 
 
 def create_category(**kwargs: Any) -> Category:
@@ -63,18 +116,10 @@ def create_category(**kwargs: Any) -> Category:
         >>> category.slug
         'power-tools'
     """
-    unique_slug = f"test-category-{uuid.uuid4().hex[:8]}"
-    defaults: dict[str, Any] = {
-        "name": "Test Category",
-        "slug": unique_slug,
-        "description": "A test category for unit testing",
-        "image_url": "https://example.com/images/category.jpg",
-        "display_order": 0,
-        "is_active": True,
-        "parent_id": None,
-    }
-    defaults.update(kwargs)
-    return Category(**defaults)
+    defaults: dict[str, Any] = {**_CATEGORY_DEFAULTS}
+    if "slug" not in kwargs:
+        defaults["slug"] = f"test-category-{_next_token()}"
+    return Category(**{**defaults, **kwargs})
 
 
 def create_session(**kwargs: Any) -> UserSession:
@@ -91,16 +136,11 @@ def create_session(**kwargs: Any) -> UserSession:
         >>> session.device_type
         'mobile'
     """
-    defaults: dict[str, Any] = {
-        "session_id": str(uuid.uuid4()),
-        "device_type": "kiosk",
-        "user_agent": "TestBrowser/1.0",
-        "ip_address": "192.168.1.100",
-        "last_active_at": datetime.now(timezone.utc),
-        "expires_at": None,
-    }
-    defaults.update(kwargs)
-    return UserSession(**defaults)
+    defaults: dict[str, Any] = {**_SESSION_DEFAULTS, "session_id": f"test-session-{_next_token()}"}
+    # Only read the clock when the caller doesn't pin the activity time
+    if "last_active_at" not in kwargs:
+        defaults["last_active_at"] = datetime.now(timezone.utc)
+    return UserSession(**{**defaults, **kwargs})
 
 
 def create_user_list(session_id: int, **kwargs: Any) -> UserList:
@@ -120,15 +160,14 @@ def create_user_list(session_id: int, **kwargs: Any) -> UserList:
         >>> user_list.name
         'My Project List'
     """
-    defaults: dict[str, Any] = {
-        "session_id": session_id,
-        "list_id": str(uuid.uuid4()),
-        "name": "My Shopping List",
-        "description": "A test shopping list",
-        "share_code": None,
-    }
-    defaults.update(kwargs)
-    return UserList(**defaults)
+    return UserList(
+        **{
+            **_USER_LIST_DEFAULTS,
+            "session_id": session_id,
+            "list_id": f"test-list-{_next_token()}",
+            **kwargs,
+        }
+    )
 
 
 def create_list_item(list_id: int, product_id: int, **kwargs: Any) -> ListItem:
@@ -150,15 +189,9 @@ def create_list_item(list_id: int, product_id: int, **kwargs: Any) -> ListItem:
         >>> item.quantity
         3
     """
-    defaults: dict[str, Any] = {
-        "list_id": list_id,
-        "product_id": product_id,
-        "quantity": 1,
-        "notes": None,
-        "price_at_add": None,
-    }
-    defaults.update(kwargs)
-    return ListItem(**defaults)
+    return ListItem(
+        **{**_LIST_ITEM_DEFAULTS, "list_id": list_id, "product_id": product_id, **kwargs}
+    )
 
 
 def create_analytics_event(session_id: int, **kwargs: Any) -> AnalyticsEvent:
@@ -182,15 +215,14 @@ def create_analytics_event(session_id: int, **kwargs: Any) -> AnalyticsEvent:
         >>> event.event_type
         'view_product'
     """
-    defaults: dict[str, Any] = {
-        "session_id": session_id,
-        "event_type": EventType.VIEW_PRODUCT.value,
-        "event_data": {"source": "test"},
-        "product_sku": None,
-        "search_query": None,
-    }
-    defaults.update(kwargs)
-    return AnalyticsEvent(**defaults)
+    return AnalyticsEvent(
+        **{
+            **_ANALYTICS_EVENT_DEFAULTS,
+            "session_id": session_id,
+            "event_data": {"source": "test"},
+            **kwargs,
+        }
+    )
 
 
 def create_product_category(product_id: int, category_id: int) -> ProductCategory:
@@ -216,6 +248,10 @@ def create_product_category(product_id: int, category_id: int) -> ProductCategor
 # ============================================================================
 # Async Helper Functions for Database Persistence
 # ============================================================================
+# These helpers flush rather than commit and refresh: the INSERT's RETURNING
+# clause fills in IDs and server defaults such as created_at. Relationships
+# are left unloaded, so query related rows explicitly instead of touching
+# attributes like product.categories, which would lazy-load outside greenlet.
 
 
 async def create_product_in_db(session, **kwargs: Any) -> Product:
@@ -230,8 +266,7 @@ async def create_product_in_db(session, **kwargs: Any) -> Product:
     """
     product = create_product(**kwargs)
     session.add(product)
-    await session.commit()
-    await session.refresh(product)
+    await session.flush([product])
     return product
 
 
@@ -247,8 +282,7 @@ async def create_category_in_db(session, **kwargs: Any) -> Category:
     """
     category = create_category(**kwargs)
     session.add(category)
-    await session.commit()
-    await session.refresh(category)
+    await session.flush([category])
     return category
 
 
@@ -264,8 +298,7 @@ async def create_session_in_db(session, **kwargs: Any) -> UserSession:
     """
     user_session = create_session(**kwargs)
     session.add(user_session)
-    await session.commit()
-    await session.refresh(user_session)
+    await session.flush([user_session])
     return user_session
 
 
@@ -282,8 +315,7 @@ async def create_user_list_in_db(session, session_id: int, **kwargs: Any) -> Use
     """
     user_list = create_user_list(session_id=session_id, **kwargs)
     session.add(user_list)
-    await session.commit()
-    await session.refresh(user_list)
+    await session.flush([user_list])
     return user_list
 
 
@@ -303,8 +335,7 @@ async def create_list_item_in_db(
     """
     item = create_list_item(list_id=list_id, product_id=product_id, **kwargs)
     session.add(item)
-    await session.commit()
-    await session.refresh(item)
+    await session.flush([item])
     return item
 
 
@@ -321,6 +352,247 @@ async def create_analytics_event_in_db(session, session_id: int, **kwargs: Any)
     """
     event = create_analytics_event(session_id=session_id, **kwargs)
     session.add(event)
-    await session.commit()
-    await session.refresh(event)
+    await session.flush([event])
     return event
+
+
+async def create_products_in_db(session, specs: list[dict[str, Any]]) -> list[Product]:
+    """Create and persist several Products with a single flush.
+
+    Args:
+        session: The async database session
+        specs: One dict of attribute overrides per product
+
+    Returns:
+        list[Product]: The persisted Product instances with IDs, in spec order
+    """
+    products = [create_product(**spec) for spec in specs]
+    session.add_all(products)
+    await session.flush()
+    return products
+
+
+async def create_categories_in_db(session, specs: list[dict[str, Any]]) -> list[Category]:
+    """Create and persist several Categories with a single flush.
+
+    Children passed via ``parent=`` are inserted in the same flush.
+
+    Args:
+        session: The async database session
+        specs: One dict of attribute overrides per category
+
+    Returns:
+        list[Category]: The persisted Category instances with IDs, in spec order
+    """
+    categories = [create_category(**spec) for spec in specs]
+    session.add_all(categories)
+    await session.flush()
+    return categories
+
+
+async def create_category_chain_in_db(
+    session, names_slugs: list[tuple[str, str]]
+) -> list[Category]:
+    """Create a parent -> child -> ... chain of Categories with a single flush.
+
+    Each category is linked to the previous one through ``parent`` so the
+    database assigns every ID and the flush resolves parent_id in order.
+
+    Args:
+        session: The async database session
+        names_slugs: (name, slug) pairs from the root down
+
+    Returns:
+        list[Category]: The persisted Category instances, root first
+    """
+    chain: list[Category] = []
+    for name, slug in names_slugs:
+        chain.append(create_category(name=name, slug=slug, parent=chain[-1] if chain else None))
+    session.add_all(chain)
+    await session.flush()
+    return chain
+
+
+async def bulk_link_product_categories(session, pairs: list[tuple[int, int]]) -> None:
+    """Insert several product/category associations in one INSERT.
+
+    Args:
+        session: The async database session
+        pairs: (product_id, category_id) pairs to link
+    """
+    await session.execute(
+        insert(ProductCategory),
+        [
+            {"product_id": product_id, "category_id": category_id}
+            for product_id, category_id in pairs
+        ],
+    )
+
+
+async def bulk_link_products(session, category_id: int, product_ids: list[int]) -> None:
+    """Associate several products with a category in one INSERT.
+
+    Args:
+        session: The async database session
+        category_id: The ID of the category
+        product_ids: The IDs of the products to link
+    """
+    await bulk_link_product_categories(
+        session, [(product_id, category_id) for product_id in product_ids]
+    )
+
+
+async def create_products_in_category(
+    session, category_id: int, n: int, sku_prefix: str
+) -> list[int]:
+    """Create n Products linked to a category with two INSERT statements.
+
+    Products are named "Product 000", "Product 001", ... with SKUs formed
+    from sku_prefix and the same zero-padded index.
+
+    Args:
+        session: The async database session
+        category_id: The ID of the category to link the products to
+        n: Number of products to create
+        sku_prefix: Prefix for each product SKU, e.g. "PROD-"
+
+    Returns:
+        list[int]: The new product IDs, in index order
+    """
+    rows = [
+        {
+            **_PRODUCT_DEFAULTS,
+            "sku": f"{sku_prefix}{i:03d}",
+            "name": f"Product {i:03d}",
+            "attributes": {"material": "steel", "color": "silver"},
+            "specifications": {"weight": "100g", "dimensions": "10x5x3cm"},
+        }
+        for i in range(n)
+    ]
+    result = await session.execute(
+        insert(Product).returning(Product.id, sort_by_parameter_order=True), rows
+    )
+    product_ids = list(result.scalars().all())
+    await bulk_link_products(session, category_id, product_ids)
+    return product_ids
+
+
+class SeededCatalog(NamedTuple):
+    """A small storefront catalog: products keyed by SKU, categories by slug."""
+
+    products: dict[str, Product]
+    categories: dict[str, Category]
+
+
+async def seed_catalog_in_db(session) -> SeededCatalog:
+    """Create a canonical product catalog with one INSERT per table.
+
+    Five active products (three featured) and two inactive ones (one
+    featured). CATALOG-001 and CATALOG-002 are in "tools", CATALOG-003 is in
+    "hardware", and CATALOG-001 carries a description, attributes and
+    specifications for detail views.
+
+    Args:
+        session: The async database session
+
+    Returns:
+        SeededCatalog: The persisted products and categories
+    """
+    products = await create_products_in_db(
+        session,
+        [
+            {
+                "sku": "CATALOG-001",
+                "name": "Cordless Drill",
+                "description": "18V drill with two batteries",
+                "price": 129.99,
+                "is_featured": True,
+                "attributes": {"color": "yellow", "voltage": "18V"},
+                "specifications": {"weight": "1.6kg", "chuck": "13mm"},
+            },
+            {"sku": "CATALOG-002", "name": "Claw Hammer", "price": 24.99, "is_featured": True},
+            {"sku": "CATALOG-003", "name": "Wood Screws", "price": 6.49, "is_featured": True},
+            {"sku": "CATALOG-004", "name": "Paint Roller", "price": 12.99},
+            {"sku": "CATALOG-005", "name": "Drop Cloth", "price": 9.99},
+            {
+                "sku": "CATALOG-006",
+                "name": "Discontinued Saw",
+                "is_featured": True,
+                "is_active": False,
+            },
+            {"sku": "CATALOG-007", "name": "Retired Sander", "is_active": False},
+        ],
+    )
+    tools, hardware = await create_categories_in_db(
+        session,
+        [{"name": "Tools", "slug": "tools"}, {"name": "Hardware", "slug": "hardware"}],
+    )
+    by_sku = {p.sku: p for p in products}
+    await bulk_link_product_categories(
+        session,
+        [
+            (by_sku["CATALOG-001"].id, tools.id),
+            (by_sku["CATALOG-002"].id, tools.id),
+            (by_sku["CATALOG-003"].id, hardware.id),
+        ],
+    )
+    return SeededCatalog(by_sku, {"tools": tools, "hardware": hardware})
+
+
+class SeededList(NamedTuple):
+    """A kiosk session owning one empty list, plus a product to add to it."""
+
+    session: UserSession
+    user_list: UserList
+    product: Product
+
+
+async def seed_list_in_db(session) -> SeededList:
+    """Create a session, an empty list it owns, and one product in a single flush.
+
+    Args:
+        session: The async database session
+
+    Returns:
+        SeededList: The persisted session, list and product
+    """
+    user_session = create_session()
+    user_list = create_user_list(session_id=None, session=user_session, name="Seeded List")
+    product = create_product(sku="SEEDED-001", name="Seeded Product", price=19.99)
+    session.add_all([user_session, user_list, product])
+    await session.flush()
+    return SeededList(user_session, user_list, product)
+
+
+async def seed_list_with_item(
+    session, *, sku: str, quantity: int = 1, price: float = 19.99, **list_kwargs: Any
+) -> SeededList:
+    """Create a session, a list it owns and a product already on that list.
+
+    All four rows are linked through relationships and inserted in a single
+    flush, so foreign keys are filled in by the unit of work.
+
+    Args:
+        session: The async database session
+        sku: SKU of the product on the list
+        quantity: Quantity of the list item
+        price: Product price, also recorded as the item's price_at_add
+        **list_kwargs: Override any default list attributes
+
+    Returns:
+        SeededList: The persisted session, list and product
+    """
+    user_session = create_session()
+    user_list = create_user_list(session_id=None, session=user_session, **list_kwargs)
+    product = create_product(sku=sku, name=f"Product {sku}", price=price)
+    item = create_list_item(
+        list_id=None,
+        product_id=None,
+        user_list=user_list,
+        product=product,
+        quantity=quantity,
+        price_at_add=price,
+    )
+    session.add_all([user_session, user_list, product, item])
+    await session.flush()
+    return SeededList(user_session, user_list, product)
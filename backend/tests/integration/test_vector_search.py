@@ -1,76 +1,111 @@
 """Integration tests for vector search flow."""
 
 import pytest
+from collections.abc import Callable
 from unittest.mock import MagicMock, patch
 
+from app.services.embedding_service import EmbeddingService
+from app.services.qdrant_service import QdrantService
+
 
 class TestVectorSearchIntegration:
     """Integration tests for the full vector search flow."""
 
-    def test_embedding_service_generates_valid_vectors(self):
+    def test_embedding_service_generates_valid_vectors(
+        self, embedding_service: EmbeddingService
+    ):
         """Test that real embedding service produces valid vectors."""
-        from app.services.embedding_service import EmbeddingService
-
-        service = EmbeddingService()
+        import numpy as np
 
         # Test single embedding
-        embedding = service.generate_embedding("cordless drill for concrete")
-        assert len(embedding) == 384
-        assert all(isinstance(x, float) for x in embedding)
+        embedding = np.asarray(embedding_service.generate_embedding("cordless drill for concrete"))
+        assert embedding.shape == (384,)
+        assert embedding.dtype.kind == "f"
 
         # Test batch embedding
         texts = ["hammer", "screwdriver", "saw"]
-        embeddings = service.batch_embeddings(texts)
-        assert len(embeddings) == 3
-        assert all(len(e) == 384 for e in embeddings)
+        embeddings = np.asarray(embedding_service.batch_embeddings(texts))
+        assert embeddings.shape == (3, 384)
 
-    def test_similar_products_have_higher_similarity(self):
+    def test_similar_products_have_higher_similarity(
+        self, embedding_service: EmbeddingService
+    ):
         """Test that semantically similar products have higher cosine similarity."""
         import numpy as np
-        from app.services.embedding_service import EmbeddingService
 
-        service = EmbeddingService()
+        # Embed related and unrelated products in a single forward pass
+        embs = np.asarray(
+            embedding_service.batch_embeddings(
+                [
+                    "cordless power drill for drilling holes",
+                    "hammer drill for concrete and masonry",
+                    "wooden garden chair for outdoor patio",
+                ]
+            )
+        )
 
-        # Generate embeddings for related and unrelated products
-        drill_emb = np.array(service.generate_embedding("cordless power drill for drilling holes"))
-        hammer_drill_emb = np.array(service.generate_embedding("hammer drill for concrete and masonry"))
-        garden_chair_emb = np.array(service.generate_embedding("wooden garden chair for outdoor patio"))
+        # Normalize once, then one matmul gives every pairwise cosine similarity
+        embs /= np.linalg.norm(embs, axis=1, keepdims=True)
+        sim = embs @ embs.T
 
-        # Calculate cosine similarities
-        def cosine_sim(a, b):
-            return np.dot(a, b) / (np.linalg.norm(a) * np.linalg.norm(b))
-
-        drill_to_hammer = cosine_sim(drill_emb, hammer_drill_emb)
-        drill_to_chair = cosine_sim(drill_emb, garden_chair_emb)
+        drill_to_hammer = sim[0, 1]
+        drill_to_chair = sim[0, 2]
 
         # Drill should be more similar to hammer drill than to garden chair
         assert drill_to_hammer > drill_to_chair
         assert drill_to_hammer > 0.5  # Should have reasonable similarity
 
-    def test_qdrant_service_crud_operations(self):
-        """Test Qdrant service with mocked client."""
-        from app.services.qdrant_service import QdrantService
-
-        mock_client = MagicMock()
-        mock_client.collection_exists.return_value = False
-
-        service = QdrantService(client=mock_client)
 
-        # Test collection creation
-        service.ensure_collection()
-        mock_client.create_collection.assert_called_once()
-
-        # Test upsert
-        service.upsert_product("SKU-001", [0.1] * 384, {"name": "Test"})
-        mock_client.upsert.assert_called_once()
-
-        # Test search
-        mock_client.search.return_value = [
+@pytest.fixture(scope="class")
+def mocked_qdrant_client() -> MagicMock:
+    """Build one mocked Qdrant client for the whole class."""
+    client = MagicMock()
+    client.collection_exists.return_value = False
+    return client
+
+
+@pytest.fixture
+def qdrant_service(mocked_qdrant_client: MagicMock) -> QdrantService:
+    """Wrap the shared mocked client, clearing call history between tests."""
+    mocked_qdrant_client.reset_mock()
+    return QdrantService(client=mocked_qdrant_client)
+
+
+class TestQdrantServiceWithMockedClient:
+    """Tests for QdrantService operations against a shared mocked client."""
+
+    @pytest.mark.parametrize(
+        "operation,client_method",
+        [
+            (lambda service: service.ensure_collection(), "create_collection"),
+            (
+                lambda service: service.upsert_product("SKU-001", [0.1] * 384, {"name": "Test"}),
+                "upsert",
+            ),
+            (lambda service: service.delete_product("SKU-001"), "delete"),
+        ],
+        ids=["create", "upsert", "delete"],
+    )
+    def test_write_operation_calls_client_once(
+        self,
+        qdrant_service: QdrantService,
+        mocked_qdrant_client: MagicMock,
+        operation: Callable[[QdrantService], None],
+        client_method: str,
+    ):
+        """Test that each write operation issues exactly one client call."""
+        operation(qdrant_service)
+
+        getattr(mocked_qdrant_client, client_method).assert_called_once()
+
+    def test_search_returns_sku_score_pairs(
+        self, qdrant_service: QdrantService, mocked_qdrant_client: MagicMock
+    ):
+        """Test that search maps scored points to (sku, score) tuples."""
+        mocked_qdrant_client.search.return_value = [
             MagicMock(payload={"sku": "SKU-001"}, score=0.9)
         ]
-        results = service.search([0.1] * 384, limit=10)
-        assert results == [("SKU-001", 0.9)]
 
-        # Test delete
-        service.delete_product("SKU-001")
-        mock_client.delete.assert_called_once()
+        results = qdrant_service.search([0.1] * 384, limit=10)
+
+        assert results == [("SKU-001", 0.9)]
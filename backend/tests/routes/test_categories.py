@@ -10,18 +10,18 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tests.factories import (
+    bulk_link_products,
     create_category_in_db,
-    create_product_category,
     create_product_in_db,
+    create_products_in_category,
 )
 
 
-class TestListCategories:
-    """Tests for GET /api/categories endpoint."""
+class TestEmptyCatalog:
+    """Tests for category listing endpoints with no categories."""
 
-    @pytest.mark.asyncio
     async def test_list_categories_returns_empty_list_when_no_categories(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient
     ):
         """Test that list categories returns empty list when no categories exist."""
         response = await test_client.get("/api/categories")
@@ -30,203 +30,78 @@ class TestListCategories:
         data = response.json()
         assert data == []
 
-    @pytest.mark.asyncio
-    async def test_list_categories_returns_all_active_categories(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that list categories returns all active categories."""
-        # Arrange
-        await create_category_in_db(
-            db_session, name="Tools", slug="tools", display_order=1
-        )
-        await create_category_in_db(
-            db_session, name="Hardware", slug="hardware", display_order=2
-        )
-        await create_category_in_db(
-            db_session, name="Paint", slug="paint", display_order=3
-        )
-
-        # Act
-        response = await test_client.get("/api/categories")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 3
-
-    @pytest.mark.asyncio
-    async def test_list_categories_excludes_inactive(
-        self, test_client: AsyncClient, db_session: AsyncSession
+    async def test_get_category_tree_returns_empty_for_no_categories(
+        self, test_client: AsyncClient
     ):
-        """Test that list categories excludes inactive categories."""
-        # Arrange
-        await create_category_in_db(
-            db_session, name="Active Category", slug="active", is_active=True
-        )
-        await create_category_in_db(
-            db_session, name="Inactive Category", slug="inactive", is_active=False
-        )
-
-        # Act
-        response = await test_client.get("/api/categories")
+        """Test that category tree returns empty list when no categories exist."""
+        response = await test_client.get("/api/categories/tree")
 
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1
-        assert data[0]["slug"] == "active"
-
-    @pytest.mark.asyncio
-    async def test_list_categories_root_only(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that list categories can filter to only root categories."""
-        # Arrange - create parent category
-        parent = await create_category_in_db(
-            db_session, name="Parent Category", slug="parent", parent_id=None
-        )
-        # Create child category
-        await create_category_in_db(
-            db_session, name="Child Category", slug="child", parent_id=parent.id
-        )
+        assert data == []
 
-        # Act - get only root categories
-        response = await test_client.get("/api/categories?root_only=true")
 
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["slug"] == "parent"
-        assert data[0]["parent_id"] is None
-
-    @pytest.mark.asyncio
-    async def test_list_categories_includes_all_when_root_only_false(
-        self, test_client: AsyncClient, db_session: AsyncSession
+@pytest.mark.usefixtures("seeded_categories")
+class TestListCategories:
+    """Tests for GET /api/categories endpoint against the seeded category graph."""
+
+    @pytest.mark.parametrize(
+        "query,expected_slugs",
+        [
+            # Children have display_order 0, so they sort ahead of the roots
+            ("", ["cordless-drills", "power-tools", "tools", "hardware", "paint"]),
+            ("?root_only=false", ["cordless-drills", "power-tools", "tools", "hardware", "paint"]),
+            ("?root_only=true", ["tools", "hardware", "paint"]),
+        ],
+    )
+    async def test_list_categories_returns_active_categories(
+        self, test_client: AsyncClient, query: str, expected_slugs: list[str]
     ):
-        """Test that list categories includes child categories when root_only=false."""
-        # Arrange
-        parent = await create_category_in_db(
-            db_session, name="Parent Category", slug="parent"
-        )
-        await create_category_in_db(
-            db_session, name="Child Category", slug="child", parent_id=parent.id
-        )
+        """Test that list categories returns only active categories, optionally roots only."""
+        response = await test_client.get(f"/api/categories{query}")
 
-        # Act
-        response = await test_client.get("/api/categories?root_only=false")
-
-        # Assert
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 2
+        assert [c["slug"] for c in response.json()] == expected_slugs
 
 
+@pytest.mark.usefixtures("seeded_categories")
 class TestGetCategoryTree:
-    """Tests for GET /api/categories/tree endpoint."""
+    """Tests for GET /api/categories/tree endpoint against the seeded category graph."""
 
-    @pytest.mark.asyncio
-    async def test_get_category_tree_returns_nested_structure(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_category_tree_returns_nested_structure(self, test_client: AsyncClient):
         """Test that category tree returns nested structure with children."""
-        # Arrange - create parent with child
-        parent = await create_category_in_db(
-            db_session, name="Tools", slug="tools"
-        )
-        await create_category_in_db(
-            db_session, name="Power Tools", slug="power-tools", parent_id=parent.id
-        )
-
-        # Act
         response = await test_client.get("/api/categories/tree")
 
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 1  # Only root category at top level
-        assert data[0]["slug"] == "tools"
-        assert len(data[0]["children"]) == 1
+        assert [c["slug"] for c in data] == ["tools", "hardware", "paint"]
         assert data[0]["children"][0]["slug"] == "power-tools"
 
-    @pytest.mark.asyncio
-    async def test_get_category_tree_returns_empty_for_no_categories(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that category tree returns empty list when no categories exist."""
-        response = await test_client.get("/api/categories/tree")
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data == []
-
-    @pytest.mark.asyncio
-    async def test_get_category_tree_multiple_levels(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_category_tree_multiple_levels(self, test_client: AsyncClient):
         """Test that category tree handles multiple levels correctly."""
-        # Arrange - create 3-level hierarchy
-        level1 = await create_category_in_db(
-            db_session, name="Level 1", slug="level-1"
-        )
-        level2 = await create_category_in_db(
-            db_session, name="Level 2", slug="level-2", parent_id=level1.id
-        )
-        await create_category_in_db(
-            db_session, name="Level 3", slug="level-3", parent_id=level2.id
-        )
-
-        # Act
         response = await test_client.get("/api/categories/tree")
 
-        # Assert
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["slug"] == "level-1"
-        assert len(data[0]["children"]) == 1
-        assert data[0]["children"][0]["slug"] == "level-2"
-        assert len(data[0]["children"][0]["children"]) == 1
-        assert data[0]["children"][0]["children"][0]["slug"] == "level-3"
-
-    @pytest.mark.asyncio
+        tools = response.json()[0]
+        power_tools = tools["children"][0]
+        assert power_tools["slug"] == "power-tools"
+        assert len(power_tools["children"]) == 1
+        assert power_tools["children"][0]["slug"] == "cordless-drills"
+
     async def test_get_category_tree_excludes_inactive_children(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient
     ):
         """Test that category tree excludes inactive child categories."""
-        # Arrange
-        parent = await create_category_in_db(
-            db_session, name="Parent", slug="parent"
-        )
-        await create_category_in_db(
-            db_session,
-            name="Active Child",
-            slug="active-child",
-            parent_id=parent.id,
-            is_active=True,
-        )
-        await create_category_in_db(
-            db_session,
-            name="Inactive Child",
-            slug="inactive-child",
-            parent_id=parent.id,
-            is_active=False,
-        )
-
-        # Act
         response = await test_client.get("/api/categories/tree")
 
-        # Assert
         assert response.status_code == 200
-        data = response.json()
-        assert len(data[0]["children"]) == 1
-        assert data[0]["children"][0]["slug"] == "active-child"
+        tools = response.json()[0]
+        assert [c["slug"] for c in tools["children"]] == ["power-tools"]
 
 
 class TestGetCategoryBySlug:
     """Tests for GET /api/categories/{slug} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_get_category_returns_category_with_products(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -242,8 +117,7 @@ class TestGetCategoryBySlug:
             db_session, sku="TOOL-001", name="Hammer", price=19.99
         )
         # Associate product with category
-        db_session.add(create_product_category(product.id, category.id))
-        await db_session.commit()
+        await bulk_link_products(db_session, category.id, [product.id])
 
         # Act
         response = await test_client.get("/api/categories/tools")
@@ -258,10 +132,7 @@ class TestGetCategoryBySlug:
         assert len(data["products"]) == 1
         assert data["products"][0]["sku"] == "TOOL-001"
 
-    @pytest.mark.asyncio
-    async def test_get_category_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_category_returns_404_for_nonexistent(self, test_client: AsyncClient):
         """Test that get category returns 404 for non-existent slug."""
         response = await test_client.get("/api/categories/nonexistent-slug")
 
@@ -269,7 +140,6 @@ class TestGetCategoryBySlug:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    @pytest.mark.asyncio
     async def test_get_category_with_empty_products(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -289,7 +159,6 @@ class TestGetCategoryBySlug:
         assert data["product_count"] == 0
         assert data["products"] == []
 
-    @pytest.mark.asyncio
     async def test_get_category_paginates_products(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -298,12 +167,7 @@ class TestGetCategoryBySlug:
         category = await create_category_in_db(
             db_session, name="Many Products", slug="many-products"
         )
-        for i in range(5):
-            product = await create_product_in_db(
-                db_session, sku=f"PROD-{i:03d}", name=f"Product {i}"
-            )
-            db_session.add(create_product_category(product.id, category.id))
-        await db_session.commit()
+        await create_products_in_category(db_session, category.id, 5, "PROD-")
 
         # Act - get first page with 2 items
         response = await test_client.get(
@@ -320,10 +184,7 @@ class TestGetCategoryBySlug:
 class TestCreateCategory:
     """Tests for POST /api/categories endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_create_category_successfully(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_create_category_successfully(self, test_client: AsyncClient):
         """Test that creating a category returns 201 and category data."""
         # Arrange
         category_data = {
@@ -344,7 +205,6 @@ class TestCreateCategory:
         assert data["description"] == "A new category description"
         assert data["display_order"] == 5
 
-    @pytest.mark.asyncio
     async def test_create_category_returns_409_for_duplicate_slug(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -367,7 +227,6 @@ class TestCreateCategory:
         data = response.json()
         assert "already exists" in data["detail"].lower()
 
-    @pytest.mark.asyncio
     async def test_create_category_with_parent(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -395,7 +254,6 @@ class TestCreateCategory:
 class TestUpdateCategory:
     """Tests for PATCH /api/categories/{slug} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_update_category_successfully(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -419,10 +277,7 @@ class TestUpdateCategory:
         assert data["description"] == "Updated description"
         assert data["slug"] == "original-slug"  # Slug unchanged
 
-    @pytest.mark.asyncio
-    async def test_update_category_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_update_category_returns_404_for_nonexistent(self, test_client: AsyncClient):
         """Test that updating a non-existent category returns 404."""
         update_data = {"name": "New Name"}
 
@@ -436,7 +291,6 @@ class TestUpdateCategory:
 class TestDeleteCategory:
     """Tests for DELETE /api/categories/{slug} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_delete_category_returns_204(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -452,16 +306,12 @@ class TestDeleteCategory:
         # Assert
         assert response.status_code == 204
 
-    @pytest.mark.asyncio
-    async def test_delete_category_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_delete_category_returns_404_for_nonexistent(self, test_client: AsyncClient):
         """Test that deleting a non-existent category returns 404."""
         response = await test_client.delete("/api/categories/nonexistent-slug")
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_deleted_category_excluded_from_list(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -5,25 +5,26 @@ verifying that the routes correctly handle requests and return
 appropriate responses.
 """
 
+from typing import Any
+
 import pytest
 from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.models import ListItem
 from tests.factories import (
+    SeededList,
     create_list_item_in_db,
-    create_product_in_db,
     create_session_in_db,
     create_user_list_in_db,
+    seed_list_with_item,
 )
 
 
 class TestCreateList:
     """Tests for POST /api/lists endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_create_list_successfully(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_create_list_successfully(self, test_client: AsyncClient):
         """Test that creating a list returns 201 and list data."""
         # Arrange
         list_data = {"name": "My Shopping List", "description": "Weekend project items"}
@@ -40,10 +41,7 @@ class TestCreateList:
         assert data["total_items"] == 0
         assert data["unique_items"] == 0
 
-    @pytest.mark.asyncio
-    async def test_create_list_with_default_name(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_create_list_with_default_name(self, test_client: AsyncClient):
         """Test that creating a list without name uses default."""
         # Arrange
         list_data = {}  # No name provided
@@ -56,10 +54,7 @@ class TestCreateList:
         data = response.json()
         assert data["name"] == "My List"  # Default name
 
-    @pytest.mark.asyncio
-    async def test_create_list_sets_session_cookie(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_create_list_sets_session_cookie(self, test_client: AsyncClient):
         """Test that creating a list sets a session cookie."""
         list_data = {"name": "Test List"}
 
@@ -75,10 +70,7 @@ class TestCreateList:
 class TestGetMyLists:
     """Tests for GET /api/lists endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_my_lists_returns_empty_for_new_session(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_my_lists_returns_empty_for_new_session(self, test_client: AsyncClient):
         """Test that get lists returns empty for new session."""
         response = await test_client.get("/api/lists")
 
@@ -86,10 +78,7 @@ class TestGetMyLists:
         data = response.json()
         assert data == []
 
-    @pytest.mark.asyncio
-    async def test_get_my_lists_returns_session_lists(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_my_lists_returns_session_lists(self, test_client: AsyncClient):
         """Test that get lists returns lists for current session."""
         # Arrange - create a list first to establish session
         create_response = await test_client.post(
@@ -97,18 +86,11 @@ class TestGetMyLists:
         )
         assert create_response.status_code == 201
 
-        # Get session cookie from response
-        cookies = dict(create_response.cookies)
-
-        # Create another list
-        await test_client.post(
-            "/api/lists",
-            json={"name": "Second List"},
-            cookies=cookies,
-        )
+        # Create another list; the client's cookie jar carries the session cookie
+        await test_client.post("/api/lists", json={"name": "Second List"})
 
         # Act - get all lists
-        response = await test_client.get("/api/lists", cookies=cookies)
+        response = await test_client.get("/api/lists")
 
         # Assert
         assert response.status_code == 200
@@ -119,26 +101,15 @@ class TestGetMyLists:
 class TestGetListById:
     """Tests for GET /api/lists/{list_id} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_get_list_returns_list_with_items(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
         """Test that get list by ID returns list with items."""
-        # Arrange - create session, list, and product
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(
-            db_session, session_id=session.id, name="Test List"
-        )
-        product = await create_product_in_db(
-            db_session, sku="PROD-001", name="Test Product", price=29.99
-        )
-        await create_list_item_in_db(
-            db_session,
-            list_id=user_list.id,
-            product_id=product.id,
-            quantity=2,
-            price_at_add=29.99,
+        # Arrange - create session, list, and product on the list
+        seeded = await seed_list_with_item(
+            db_session, sku="PROD-001", quantity=2, price=29.99, name="Test List"
         )
+        user_list = seeded.user_list
 
         # Act
         response = await test_client.get(f"/api/lists/{user_list.list_id}")
@@ -154,18 +125,6 @@ class TestGetListById:
         assert data["items"][0]["quantity"] == 2
         assert data["items"][0]["product"]["sku"] == "PROD-001"
 
-    @pytest.mark.asyncio
-    async def test_get_list_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that get list returns 404 for non-existent list ID."""
-        response = await test_client.get("/api/lists/nonexistent-list-id")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert "not found" in data["detail"].lower()
-
-    @pytest.mark.asyncio
     async def test_get_list_returns_empty_items_for_new_list(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -190,23 +149,20 @@ class TestGetListById:
 class TestAddItemToList:
     """Tests for POST /api/lists/{list_id}/items endpoint."""
 
-    @pytest.mark.asyncio
     async def test_add_item_to_list_successfully(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that adding an item to list returns 201 and item data."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        product = await create_product_in_db(
-            db_session, sku="ADD-ITEM-001", name="Product to Add", price=19.99
-        )
-
-        item_data = {"product_sku": product.sku, "quantity": 3, "notes": "Need for project"}
+        item_data = {
+            "product_sku": seeded_list.product.sku,
+            "quantity": 3,
+            "notes": "Need for project",
+        }
 
         # Act
         response = await test_client.post(
-            f"/api/lists/{user_list.list_id}/items", json=item_data
+            f"/api/lists/{seeded_list.user_list.list_id}/items", json=item_data
         )
 
         # Assert
@@ -214,65 +170,34 @@ class TestAddItemToList:
         data = response.json()
         assert data["quantity"] == 3
         assert data["notes"] == "Need for project"
-        assert data["product"]["sku"] == "ADD-ITEM-001"
+        assert data["product"]["sku"] == seeded_list.product.sku
         assert data["price_at_add"] == 19.99
 
-    @pytest.mark.asyncio
-    async def test_add_item_returns_404_for_nonexistent_list(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that adding item to non-existent list returns 404."""
-        # Arrange
-        product = await create_product_in_db(
-            db_session, sku="PROD-001", name="Test Product"
-        )
-
-        item_data = {"product_sku": product.sku, "quantity": 1}
-
-        # Act
-        response = await test_client.post(
-            "/api/lists/nonexistent-list-id/items", json=item_data
-        )
-
-        # Assert
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
     async def test_add_item_returns_404_for_nonexistent_product(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that adding non-existent product returns 404."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-
         item_data = {"product_sku": "NONEXISTENT-SKU", "quantity": 1}
 
         # Act
         response = await test_client.post(
-            f"/api/lists/{user_list.list_id}/items", json=item_data
+            f"/api/lists/{seeded_list.user_list.list_id}/items", json=item_data
         )
 
         # Assert
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_add_item_validates_quantity(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that adding item validates quantity constraints."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        product = await create_product_in_db(
-            db_session, sku="VALIDATE-QTY", name="Test Product"
-        )
-
-        item_data = {"product_sku": product.sku, "quantity": 0}  # Invalid quantity
+        item_data = {"product_sku": seeded_list.product.sku, "quantity": 0}  # Invalid quantity
 
         # Act
         response = await test_client.post(
-            f"/api/lists/{user_list.list_id}/items", json=item_data
+            f"/api/lists/{seeded_list.user_list.list_id}/items", json=item_data
         )
 
         # Assert
@@ -282,93 +207,51 @@ class TestAddItemToList:
 class TestRemoveItemFromList:
     """Tests for DELETE /api/lists/{list_id}/items/{sku} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_remove_item_returns_204(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, db_session: AsyncSession, seeded_list: SeededList
     ):
         """Test that removing an item returns 204 No Content."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        product = await create_product_in_db(
-            db_session, sku="REMOVE-001", name="To Remove"
-        )
-        await create_list_item_in_db(
-            db_session, list_id=user_list.id, product_id=product.id
-        )
+        user_list, product = seeded_list.user_list, seeded_list.product
+        await create_list_item_in_db(db_session, list_id=user_list.id, product_id=product.id)
 
         # Act
         response = await test_client.delete(
-            f"/api/lists/{user_list.list_id}/items/REMOVE-001"
+            f"/api/lists/{user_list.list_id}/items/{product.sku}"
         )
 
         # Assert
         assert response.status_code == 204
 
-    @pytest.mark.asyncio
-    async def test_remove_item_returns_404_for_nonexistent_item(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that removing non-existent item returns 404."""
-        # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-
-        # Act
-        response = await test_client.delete(
-            f"/api/lists/{user_list.list_id}/items/NONEXISTENT-SKU"
-        )
-
-        # Assert
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
     async def test_remove_item_updates_list_counts(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, db_session: AsyncSession, seeded_list: SeededList
     ):
         """Test that removing an item removes it from the list."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        product = await create_product_in_db(
-            db_session, sku="COUNT-001", name="Count Test"
-        )
-        await create_list_item_in_db(
+        user_list, product = seeded_list.user_list, seeded_list.product
+        item = await create_list_item_in_db(
             db_session, list_id=user_list.id, product_id=product.id, quantity=5
         )
 
-        # Verify initial item exists
-        response = await test_client.get(f"/api/lists/{user_list.list_id}")
-        initial_data = response.json()
-        assert len(initial_data["items"]) == 1
-        assert initial_data["items"][0]["quantity"] == 5
-
-        # Remove item - should succeed with 204
+        # Act
         delete_response = await test_client.delete(
-            f"/api/lists/{user_list.list_id}/items/COUNT-001"
+            f"/api/lists/{user_list.list_id}/items/{product.sku}"
         )
-        assert delete_response.status_code == 204
 
-        # Verify item is removed by attempting to remove again (should 404)
-        second_delete = await test_client.delete(
-            f"/api/lists/{user_list.list_id}/items/COUNT-001"
-        )
-        assert second_delete.status_code == 404
+        # Assert - the row is gone
+        assert delete_response.status_code == 204
+        assert await db_session.get(ListItem, item.id) is None
 
 
 class TestGenerateShareCode:
     """Tests for POST /api/lists/{list_id}/share endpoint."""
 
-    @pytest.mark.asyncio
     async def test_generate_share_code_successfully(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that generating share code returns code and sync URL."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(
-            db_session, session_id=session.id, name="Shareable List"
-        )
+        user_list = seeded_list.user_list
 
         # Act
         response = await test_client.post(f"/api/lists/{user_list.list_id}/share")
@@ -381,23 +264,12 @@ class TestGenerateShareCode:
         assert len(data["share_code"]) > 0
         assert f"/api/lists/sync/{data['share_code']}" == data["sync_url"]
 
-    @pytest.mark.asyncio
-    async def test_generate_share_code_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that generating share code for non-existent list returns 404."""
-        response = await test_client.post("/api/lists/nonexistent-list-id/share")
-
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
     async def test_generate_share_code_idempotent(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that generating share code multiple times returns same code."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
+        user_list = seeded_list.user_list
 
         # Act - generate code twice
         response1 = await test_client.post(f"/api/lists/{user_list.list_id}/share")
@@ -413,28 +285,20 @@ class TestGenerateShareCode:
 class TestSyncListFromCode:
     """Tests for POST /api/lists/sync/{share_code} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_sync_list_from_code_successfully(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
         """Test that syncing list from code clones the list."""
         # Arrange - create source list with items
-        source_session = await create_session_in_db(db_session)
-        source_list = await create_user_list_in_db(
+        seeded = await seed_list_with_item(
             db_session,
-            session_id=source_session.id,
+            sku="SYNC-PROD",
+            quantity=2,
+            price=49.99,
             name="Source List",
             share_code="TEST-SHARE-CODE",
         )
-        product = await create_product_in_db(
-            db_session, sku="SYNC-PROD", name="Sync Product", price=49.99
-        )
-        await create_list_item_in_db(
-            db_session,
-            list_id=source_list.id,
-            product_id=product.id,
-            quantity=2,
-        )
+        source_list = seeded.user_list
 
         # Act - sync to new session
         response = await test_client.post("/api/lists/sync/TEST-SHARE-CODE")
@@ -447,33 +311,16 @@ class TestSyncListFromCode:
         assert len(data["items"]) == 1
         assert data["items"][0]["product"]["sku"] == "SYNC-PROD"
 
-    @pytest.mark.asyncio
-    async def test_sync_list_returns_404_for_invalid_code(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that syncing with invalid code returns 404."""
-        response = await test_client.post("/api/lists/sync/INVALID-CODE")
-
-        assert response.status_code == 404
-        data = response.json()
-        # Error message contains "no list found" with the share code
-        assert "found" in data["detail"].lower()
-
 
 class TestUpdateListItem:
     """Tests for PATCH /api/lists/{list_id}/items/{sku} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_update_list_item_quantity(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, db_session: AsyncSession, seeded_list: SeededList
     ):
         """Test that updating list item quantity works correctly."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        product = await create_product_in_db(
-            db_session, sku="UPDATE-QTY-001", name="Update Quantity"
-        )
+        user_list, product = seeded_list.user_list, seeded_list.product
         await create_list_item_in_db(
             db_session,
             list_id=user_list.id,
@@ -485,7 +332,7 @@ class TestUpdateListItem:
 
         # Act
         response = await test_client.patch(
-            f"/api/lists/{user_list.list_id}/items/UPDATE-QTY-001",
+            f"/api/lists/{user_list.list_id}/items/{product.sku}",
             json=update_data,
         )
 
@@ -494,17 +341,12 @@ class TestUpdateListItem:
         data = response.json()
         assert data["quantity"] == 5
 
-    @pytest.mark.asyncio
     async def test_update_list_item_notes(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, db_session: AsyncSession, seeded_list: SeededList
     ):
         """Test that updating list item notes works correctly."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        product = await create_product_in_db(
-            db_session, sku="UPDATE-NOTES-001", name="Update Notes"
-        )
+        user_list, product = seeded_list.user_list, seeded_list.product
         await create_list_item_in_db(
             db_session,
             list_id=user_list.id,
@@ -515,7 +357,7 @@ class TestUpdateListItem:
 
         # Act
         response = await test_client.patch(
-            f"/api/lists/{user_list.list_id}/items/UPDATE-NOTES-001",
+            f"/api/lists/{user_list.list_id}/items/{product.sku}",
             json=update_data,
         )
 
@@ -524,65 +366,26 @@ class TestUpdateListItem:
         data = response.json()
         assert data["notes"] == "Updated notes here"
 
-    @pytest.mark.asyncio
-    async def test_update_list_item_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that updating non-existent item returns 404."""
-        # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-
-        update_data = {"quantity": 5}
-
-        # Act
-        response = await test_client.patch(
-            f"/api/lists/{user_list.list_id}/items/NONEXISTENT-SKU",
-            json=update_data,
-        )
-
-        # Assert
-        assert response.status_code == 404
-
 
 class TestDeleteList:
     """Tests for DELETE /api/lists/{list_id} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_delete_list_returns_204(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that deleting a list returns 204 No Content."""
-        # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(
-            db_session, session_id=session.id, name="To Delete"
-        )
-
         # Act
-        response = await test_client.delete(f"/api/lists/{user_list.list_id}")
+        response = await test_client.delete(f"/api/lists/{seeded_list.user_list.list_id}")
 
         # Assert
         assert response.status_code == 204
 
-    @pytest.mark.asyncio
-    async def test_delete_list_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that deleting non-existent list returns 404."""
-        response = await test_client.delete("/api/lists/nonexistent-list-id")
-
-        assert response.status_code == 404
-
-    @pytest.mark.asyncio
     async def test_deleted_list_not_accessible(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_list: SeededList
     ):
         """Test that deleted list is no longer accessible."""
         # Arrange
-        session = await create_session_in_db(db_session)
-        user_list = await create_user_list_in_db(db_session, session_id=session.id)
-        list_id = user_list.list_id
+        list_id = seeded_list.user_list.list_id
 
         # Delete the list
         await test_client.delete(f"/api/lists/{list_id}")
@@ -591,3 +394,75 @@ class TestDeleteList:
         response = await test_client.get(f"/api/lists/{list_id}")
 
         assert response.status_code == 404
+
+
+class TestListNotFound:
+    """Tests for 404 responses across the /api/lists endpoints."""
+
+    @pytest.mark.parametrize(
+        "method,path,json,expected_detail",
+        [
+            ("GET", "/api/lists/nonexistent-list-id", None, "List 'nonexistent-list-id' not found"),
+            (
+                "DELETE",
+                "/api/lists/nonexistent-list-id",
+                None,
+                "List 'nonexistent-list-id' not found",
+            ),
+            (
+                "POST",
+                "/api/lists/nonexistent-list-id/items",
+                {"product_sku": "SEEDED-001", "quantity": 1},
+                "List or product not found",
+            ),
+            (
+                "POST",
+                "/api/lists/nonexistent-list-id/share",
+                None,
+                "List 'nonexistent-list-id' not found",
+            ),
+            (
+                "POST",
+                "/api/lists/sync/INVALID-CODE",
+                None,
+                "No list found with share code 'INVALID-CODE'",
+            ),
+            (
+                "DELETE",
+                "/api/lists/{list_id}/items/NONEXISTENT-SKU",
+                None,
+                "List or item not found",
+            ),
+            (
+                "PATCH",
+                "/api/lists/{list_id}/items/NONEXISTENT-SKU",
+                {"quantity": 5},
+                "List or item not found",
+            ),
+        ],
+        ids=[
+            "get-list",
+            "delete-list",
+            "add-item",
+            "share-list",
+            "sync-list",
+            "remove-item",
+            "update-item",
+        ],
+    )
+    async def test_returns_404_for_nonexistent(
+        self,
+        test_client: AsyncClient,
+        seeded_list: SeededList,
+        method: str,
+        path: str,
+        json: dict[str, Any] | None,
+        expected_detail: str,
+    ):
+        """Test that unknown lists, items and share codes return 404 with their own detail."""
+        response = await test_client.request(
+            method, path.format(list_id=seeded_list.user_list.list_id), json=json
+        )
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == expected_detail
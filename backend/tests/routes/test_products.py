@@ -5,23 +5,25 @@ verifying that the routes correctly handle requests and return
 appropriate responses.
 """
 
+import json
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 from httpx import AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from tests.factories import (
-    create_category_in_db,
-    create_product_category,
-    create_product_in_db,
-)
+from tests.factories import SeededCatalog, create_product_in_db
 
+ACTIVE_SKUS = {"CATALOG-001", "CATALOG-002", "CATALOG-003", "CATALOG-004", "CATALOG-005"}
+FEATURED_SKUS = {"CATALOG-001", "CATALOG-002", "CATALOG-003"}
 
-class TestListProducts:
-    """Tests for GET /api/products endpoint."""
 
-    @pytest.mark.asyncio
+class TestEmptyCatalog:
+    """Tests for product endpoints before any products exist."""
+
     async def test_list_products_returns_empty_list_when_no_products(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient
     ):
         """Test that list products returns empty list when no products exist."""
         response = await test_client.get("/api/products")
@@ -34,305 +36,230 @@ class TestListProducts:
         assert data["page_size"] == 20
         assert data["pages"] == 1
 
-    @pytest.mark.asyncio
-    async def test_list_products_returns_all_products(
+    async def test_get_featured_returns_empty_when_no_featured(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
-        """Test that list products returns all active products."""
-        # Arrange - create test products
-        await create_product_in_db(
-            db_session, sku="PROD-001", name="Product A", price=19.99
-        )
-        await create_product_in_db(
-            db_session, sku="PROD-002", name="Product B", price=29.99
-        )
+        """Test that featured endpoint returns empty list when no featured products."""
+        # Arrange
         await create_product_in_db(
-            db_session, sku="PROD-003", name="Product C", price=39.99
+            db_session, sku="NORMAL-001", name="Normal Product", is_featured=False
         )
 
         # Act
-        response = await test_client.get("/api/products")
+        response = await test_client.get("/api/products/featured")
 
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["total"] == 3
-        assert len(data["items"]) == 3
-        assert data["page"] == 1
-        assert data["pages"] == 1
+        assert len(data) == 0
 
-    @pytest.mark.asyncio
-    async def test_list_products_excludes_inactive_products(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that list products excludes inactive products by default."""
-        # Arrange
-        await create_product_in_db(
-            db_session, sku="ACTIVE-001", name="Active Product", is_active=True
-        )
-        await create_product_in_db(
-            db_session, sku="INACTIVE-001", name="Inactive Product", is_active=False
-        )
 
-        # Act
+@pytest.mark.usefixtures("seeded_catalog")
+class TestListProducts:
+    """Tests for GET /api/products endpoint."""
+
+    async def test_list_products_returns_active_products(self, test_client: AsyncClient):
+        """Test that list products returns every active product and no inactive ones."""
         response = await test_client.get("/api/products")
 
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["total"] == 1
-        assert data["items"][0]["sku"] == "ACTIVE-001"
+        assert data["total"] == len(ACTIVE_SKUS)
+        assert {item["sku"] for item in data["items"]} == ACTIVE_SKUS
+        assert data["page"] == 1
+        assert data["pages"] == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page,expected_len", [(1, 2), (2, 2), (3, 1)])
     async def test_list_products_pagination(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, page: int, expected_len: int
     ):
         """Test that list products handles pagination correctly."""
-        # Arrange - create 5 products
-        for i in range(5):
-            await create_product_in_db(
-                db_session, sku=f"PROD-{i:03d}", name=f"Product {i}", price=10.0 + i
-            )
+        response = await test_client.get(f"/api/products?page={page}&page_size=2")
 
-        # Act - get first page
-        response = await test_client.get("/api/products?page=1&page_size=2")
-
-        # Assert
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 5
-        assert len(data["items"]) == 2
-        assert data["page"] == 1
+        assert len(data["items"]) == expected_len
+        assert data["page"] == page
         assert data["page_size"] == 2
         assert data["pages"] == 3  # ceil(5/2) = 3
 
-    @pytest.mark.asyncio
-    async def test_list_products_second_page(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test fetching second page of products."""
-        # Arrange - create 5 products
-        for i in range(5):
-            await create_product_in_db(
-                db_session, sku=f"PAGE-{i:03d}", name=f"Page Product {i}", price=10.0 + i
-            )
-
-        # Act - get second page
-        response = await test_client.get("/api/products?page=2&page_size=2")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert data["total"] == 5
-        assert len(data["items"]) == 2
-        assert data["page"] == 2
-
-    @pytest.mark.asyncio
-    async def test_list_products_filters_by_featured(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_list_products_filters_by_featured(self, test_client: AsyncClient):
         """Test that list products can filter by featured flag."""
-        # Arrange
-        await create_product_in_db(
-            db_session, sku="FEATURED-001", name="Featured Product", is_featured=True
-        )
-        await create_product_in_db(
-            db_session, sku="NORMAL-001", name="Normal Product", is_featured=False
-        )
-
-        # Act
         response = await test_client.get("/api/products?featured=true")
 
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["total"] == 1
-        assert data["items"][0]["sku"] == "FEATURED-001"
-        assert data["items"][0]["is_featured"] is True
+        assert data["total"] == len(FEATURED_SKUS)
+        assert {item["sku"] for item in data["items"]} == FEATURED_SKUS
+        assert all(item["is_featured"] is True for item in data["items"])
 
-    @pytest.mark.asyncio
     async def test_list_products_filters_by_category(
-        self, test_client: AsyncClient, db_session: AsyncSession
+        self, test_client: AsyncClient, seeded_catalog: SeededCatalog
     ):
         """Test that list products can filter by category ID."""
-        # Arrange - create categories
-        category = await create_category_in_db(
-            db_session, name="Tools", slug="tools"
-        )
-        other_category = await create_category_in_db(
-            db_session, name="Hardware", slug="hardware"
-        )
+        hardware = seeded_catalog.categories["hardware"]
 
-        # Create products
-        product1 = await create_product_in_db(
-            db_session, sku="TOOL-001", name="Tool Product"
-        )
-        product2 = await create_product_in_db(
-            db_session, sku="HARDWARE-001", name="Hardware Product"
-        )
-
-        # Associate products with categories
-        db_session.add(create_product_category(product1.id, category.id))
-        db_session.add(create_product_category(product2.id, other_category.id))
-        await db_session.commit()
+        response = await test_client.get(f"/api/products?category_id={hardware.id}")
 
-        # Act
-        response = await test_client.get(f"/api/products?category_id={category.id}")
-
-        # Assert
         assert response.status_code == 200
         data = response.json()
         assert data["total"] == 1
-        assert data["items"][0]["sku"] == "TOOL-001"
+        assert data["items"][0]["sku"] == "CATALOG-003"
 
 
+@pytest.mark.usefixtures("seeded_catalog")
 class TestGetFeaturedProducts:
     """Tests for GET /api/products/featured endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_featured_returns_featured_products(
-        self, test_client: AsyncClient, db_session: AsyncSession
+    async def test_get_featured_returns_active_featured_products(
+        self, test_client: AsyncClient
     ):
-        """Test that featured endpoint returns featured products."""
-        # Arrange
-        await create_product_in_db(
-            db_session,
-            sku="FEATURED-001",
-            name="Featured Product 1",
-            is_featured=True,
-        )
-        await create_product_in_db(
-            db_session,
-            sku="FEATURED-002",
-            name="Featured Product 2",
-            is_featured=True,
-        )
-        await create_product_in_db(
-            db_session,
-            sku="NORMAL-001",
-            name="Normal Product",
-            is_featured=False,
-        )
-
-        # Act
+        """Test that featured endpoint returns active featured products only."""
         response = await test_client.get("/api/products/featured")
 
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 2
-        for product in data:
-            assert product["is_featured"] is True
+        assert {product["sku"] for product in data} == FEATURED_SKUS
+        assert all(product["is_featured"] is True for product in data)
 
-    @pytest.mark.asyncio
-    async def test_get_featured_returns_empty_when_no_featured(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that featured endpoint returns empty list when no featured products."""
-        # Arrange
-        await create_product_in_db(
-            db_session, sku="NORMAL-001", name="Normal Product", is_featured=False
-        )
-
-        # Act
-        response = await test_client.get("/api/products/featured")
+    async def test_get_featured_respects_limit(self, test_client: AsyncClient):
+        """Test that featured endpoint respects limit parameter."""
+        response = await test_client.get("/api/products/featured?limit=2")
 
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert len(data) == 0
+        assert len(data) == 2
 
-    @pytest.mark.asyncio
-    async def test_get_featured_respects_limit(
-        self, test_client: AsyncClient, db_session: AsyncSession
+
+@pytest.mark.usefixtures("seeded_catalog")
+class TestFeaturedProductsCache:
+    """Tests for Redis caching of GET /api/products/featured."""
+
+    async def test_miss_reads_db_and_caches_result(
+        self, test_client: AsyncClient, mock_redis_client: MagicMock
     ):
-        """Test that featured endpoint respects limit parameter."""
-        # Arrange - create 5 featured products
-        for i in range(5):
-            await create_product_in_db(
-                db_session,
-                sku=f"FEATURED-{i:03d}",
-                name=f"Featured {i}",
-                is_featured=True,
-            )
+        """Test that a cache miss is served from the database and then cached."""
+        response = await test_client.get("/api/products/featured?limit=2")
 
-        # Act
-        response = await test_client.get("/api/products/featured?limit=3")
+        assert response.status_code == 200
+        mock_redis_client.get.assert_awaited_once_with("featured:2")
+        key, value = mock_redis_client.set.await_args.args
+        assert key == "featured:2"
+        assert json.loads(value) == response.json()
+
+    async def test_hit_skips_db(
+        self,
+        test_client: AsyncClient,
+        mock_redis_client: MagicMock,
+        query_counter: list[str],
+    ):
+        """Test that a cache hit is returned without querying the database."""
+        first = await test_client.get("/api/products/featured")
+        mock_redis_client.get = AsyncMock(return_value=mock_redis_client.set.await_args.args[1])
+        mock_redis_client.set.reset_mock()
+        query_counter.clear()
+
+        response = await test_client.get("/api/products/featured")
 
-        # Assert
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 3
+        assert response.json() == first.json()
+        assert query_counter == []
+        mock_redis_client.set.assert_not_awaited()
 
-    @pytest.mark.asyncio
-    async def test_get_featured_excludes_inactive_products(
-        self, test_client: AsyncClient, db_session: AsyncSession
+    async def test_redis_outage_falls_back_to_db(
+        self, test_client: AsyncClient, mock_redis_client: MagicMock
     ):
-        """Test that featured endpoint excludes inactive products."""
-        # Arrange
-        await create_product_in_db(
-            db_session,
-            sku="FEATURED-ACTIVE",
-            name="Featured Active",
-            is_featured=True,
-            is_active=True,
-        )
-        await create_product_in_db(
-            db_session,
-            sku="FEATURED-INACTIVE",
-            name="Featured Inactive",
-            is_featured=True,
-            is_active=False,
-        )
+        """Test that an unreachable Redis does not fail the request."""
+        mock_redis_client.get = AsyncMock(side_effect=RedisConnectionError())
+        mock_redis_client.set = AsyncMock(side_effect=RedisConnectionError())
 
-        # Act
         response = await test_client.get("/api/products/featured")
 
-        # Assert
         assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert data[0]["sku"] == "FEATURED-ACTIVE"
+        assert {product["sku"] for product in response.json()} == FEATURED_SKUS
+
+
+class TestProductWriteCacheInvalidation:
+    """Tests that product writes invalidate the featured and facets caches."""
+
+    @pytest.fixture
+    def cached_keys(self, mock_redis_client: MagicMock) -> list[str]:
+        """Serve a set of cached keys from SCAN and return them."""
+        keys = ["featured:10", "featured:2", "facets:all", "facets:3"]
+
+        async def scan_iter(match: str):
+            for key in keys:
+                if key.startswith(match.rstrip("*")):
+                    yield key
+
+        mock_redis_client.scan_iter = MagicMock(side_effect=scan_iter)
+        return keys
+
+    @pytest.fixture
+    async def cached_product(self, db_session: AsyncSession) -> None:
+        """Create the product that the update and delete cases write to."""
+        await create_product_in_db(db_session, sku="CACHED-001", name="Cached")
+
+    @pytest.mark.usefixtures("cached_product")
+    @pytest.mark.parametrize(
+        "method,path,json_body,expected_status",
+        [
+            ("POST", "/api/products", {"sku": "NEW-001", "name": "New", "price": 5.0}, 201),
+            ("PATCH", "/api/products/CACHED-001", {"name": "Renamed"}, 200),
+            ("DELETE", "/api/products/CACHED-001", None, 204),
+        ],
+        ids=["create", "update", "delete"],
+    )
+    async def test_write_invalidates_featured_and_facets(
+        self,
+        test_client: AsyncClient,
+        mock_redis_client: MagicMock,
+        cached_keys: list[str],
+        method: str,
+        path: str,
+        json_body: dict | None,
+        expected_status: int,
+    ):
+        """Test that every product write clears both cache prefixes."""
+        response = await test_client.request(method, path, json=json_body)
+
+        assert response.status_code == expected_status
+        matches = [c.kwargs["match"] for c in mock_redis_client.scan_iter.call_args_list]
+        assert matches == ["featured:*", "facets:*"]
+        mock_redis_client.delete.assert_awaited_once_with(*cached_keys)
+
+    async def test_failed_write_does_not_invalidate(
+        self, test_client: AsyncClient, mock_redis_client: MagicMock
+    ):
+        """Test that a write rejected with 404 leaves the cache alone."""
+        response = await test_client.patch("/api/products/NONEXISTENT-SKU", json={"name": "X"})
+
+        assert response.status_code == 404
+        mock_redis_client.scan_iter.assert_not_called()
 
 
+@pytest.mark.usefixtures("seeded_catalog")
 class TestGetProductBySku:
     """Tests for GET /api/products/{sku} endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_get_product_returns_product_details(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_product_returns_product_details(self, test_client: AsyncClient):
         """Test that get product by SKU returns full product details."""
-        # Arrange
-        await create_product_in_db(
-            db_session,
-            sku="TEST-SKU-001",
-            name="Test Product",
-            description="Full description here",
-            price=49.99,
-            is_featured=True,
-            attributes={"color": "red", "size": "large"},
-            specifications={"weight": "500g", "material": "steel"},
-        )
+        response = await test_client.get("/api/products/CATALOG-001")
 
-        # Act
-        response = await test_client.get("/api/products/TEST-SKU-001")
-
-        # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["sku"] == "TEST-SKU-001"
-        assert data["name"] == "Test Product"
-        assert data["description"] == "Full description here"
-        assert data["price"] == 49.99
+        assert data["sku"] == "CATALOG-001"
+        assert data["name"] == "Cordless Drill"
+        assert data["description"] == "18V drill with two batteries"
+        assert data["price"] == 129.99
         assert data["is_featured"] is True
-        assert data["attributes"] == {"color": "red", "size": "large"}
-        assert data["specifications"] == {"weight": "500g", "material": "steel"}
+        assert data["attributes"] == {"color": "yellow", "voltage": "18V"}
+        assert data["specifications"] == {"weight": "1.6kg", "chuck": "13mm"}
+        assert data["created_at"] is not None
+        assert data["updated_at"] is not None
 
-    @pytest.mark.asyncio
-    async def test_get_product_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_get_product_returns_404_for_nonexistent(self, test_client: AsyncClient):
         """Test that get product returns 404 for non-existent SKU."""
         response = await test_client.get("/api/products/NONEXISTENT-SKU")
 
@@ -340,35 +267,11 @@ class TestGetProductBySku:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    @pytest.mark.asyncio
-    async def test_get_product_includes_timestamps(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
-        """Test that get product returns created_at and updated_at timestamps."""
-        # Arrange
-        await create_product_in_db(
-            db_session, sku="TIMESTAMP-001", name="Timestamp Product"
-        )
-
-        # Act
-        response = await test_client.get("/api/products/TIMESTAMP-001")
-
-        # Assert
-        assert response.status_code == 200
-        data = response.json()
-        assert "created_at" in data
-        assert "updated_at" in data
-        assert data["created_at"] is not None
-        assert data["updated_at"] is not None
-
 
 class TestCreateProduct:
     """Tests for POST /api/products endpoint."""
 
-    @pytest.mark.asyncio
-    async def test_create_product_successfully(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_create_product_successfully(self, test_client: AsyncClient):
         """Test that creating a product returns 201 and product data."""
         # Arrange
         product_data = {
@@ -388,7 +291,6 @@ class TestCreateProduct:
         assert data["name"] == "New Product"
         assert data["price"] == 29.99
 
-    @pytest.mark.asyncio
     async def test_create_product_returns_409_for_duplicate_sku(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -412,10 +314,7 @@ class TestCreateProduct:
         data = response.json()
         assert "already exists" in data["detail"].lower()
 
-    @pytest.mark.asyncio
-    async def test_create_product_validates_required_fields(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_create_product_validates_required_fields(self, test_client: AsyncClient):
         """Test that creating a product without required fields returns 422."""
         # Arrange - missing sku, name, and price
         product_data = {"description": "Only description provided"}
@@ -430,7 +329,6 @@ class TestCreateProduct:
 class TestUpdateProduct:
     """Tests for PATCH /api/products/{sku} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_update_product_successfully(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -455,10 +353,7 @@ class TestUpdateProduct:
         assert data["price"] == 29.99
         assert data["sku"] == "UPDATE-SKU-001"  # SKU unchanged
 
-    @pytest.mark.asyncio
-    async def test_update_product_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_update_product_returns_404_for_nonexistent(self, test_client: AsyncClient):
         """Test that updating a non-existent product returns 404."""
         update_data = {"name": "New Name"}
 
@@ -466,7 +361,6 @@ class TestUpdateProduct:
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_update_product_partial_update(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -496,7 +390,6 @@ class TestUpdateProduct:
 class TestDeleteProduct:
     """Tests for DELETE /api/products/{sku} endpoint."""
 
-    @pytest.mark.asyncio
     async def test_delete_product_returns_204(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -512,16 +405,12 @@ class TestDeleteProduct:
         # Assert
         assert response.status_code == 204
 
-    @pytest.mark.asyncio
-    async def test_delete_product_returns_404_for_nonexistent(
-        self, test_client: AsyncClient, db_session: AsyncSession
-    ):
+    async def test_delete_product_returns_404_for_nonexistent(self, test_client: AsyncClient):
         """Test that deleting a non-existent product returns 404."""
         response = await test_client.delete("/api/products/NONEXISTENT-SKU")
 
         assert response.status_code == 404
 
-    @pytest.mark.asyncio
     async def test_deleted_product_excluded_from_list(
         self, test_client: AsyncClient, db_session: AsyncSession
     ):
@@ -531,13 +420,9 @@ class TestDeleteProduct:
             db_session, sku="DELETE-CHECK-001", name="To Be Deleted"
         )
 
-        # Verify product exists in list
-        response = await test_client.get("/api/products")
-        assert response.status_code == 200
-        assert response.json()["total"] == 1
-
         # Delete the product
-        await test_client.delete("/api/products/DELETE-CHECK-001")
+        response = await test_client.delete("/api/products/DELETE-CHECK-001")
+        assert response.status_code == 204
 
         # Verify product is excluded from list
         response = await test_client.get("/api/products")
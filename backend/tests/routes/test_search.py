@@ -0,0 +1,73 @@
+"""Integration tests for search API routes.
+
+This module contains tests for the /api/search endpoints,
+verifying that the routes correctly handle requests and return
+appropriate responses.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from httpx import AsyncClient
+from redis.exceptions import ConnectionError as RedisConnectionError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tests.factories import create_category_in_db
+
+
+class TestSearchFiltersCache:
+    """Tests for Redis caching of GET /api/search/filters."""
+
+    async def test_miss_reads_db_and_caches_result(
+        self, test_client: AsyncClient, db_session: AsyncSession, mock_redis_client: MagicMock
+    ):
+        """Test that a cache miss is served from the database and then cached."""
+        await create_category_in_db(db_session, name="Tools", slug="tools")
+
+        response = await test_client.get("/api/search/filters")
+
+        assert response.status_code == 200
+        assert [c["slug"] for c in response.json()["categories"]] == ["tools"]
+        mock_redis_client.get.assert_awaited_once_with("facets:all")
+        key, value = mock_redis_client.set.await_args.args
+        assert key == "facets:all"
+        assert json.loads(value) == response.json()
+
+    async def test_hit_skips_db(
+        self,
+        test_client: AsyncClient,
+        mock_redis_client: MagicMock,
+        query_counter: list[str],
+    ):
+        """Test that a cache hit is returned without querying the database."""
+        cached = {"price_range": {"min": 1.0, "max": 9.0}, "categories": []}
+        mock_redis_client.get = AsyncMock(return_value=json.dumps(cached))
+
+        response = await test_client.get("/api/search/filters")
+
+        assert response.status_code == 200
+        assert response.json() == cached
+        assert query_counter == []
+        mock_redis_client.set.assert_not_awaited()
+
+    async def test_category_zero_uses_its_own_key(
+        self, test_client: AsyncClient, mock_redis_client: MagicMock
+    ):
+        """Test that category_id=0 is not served the unscoped facets."""
+        response = await test_client.get("/api/search/filters?category_id=0")
+
+        assert response.status_code == 200
+        mock_redis_client.get.assert_awaited_once_with("facets:0")
+
+    async def test_redis_outage_falls_back_to_db(
+        self, test_client: AsyncClient, db_session: AsyncSession, mock_redis_client: MagicMock
+    ):
+        """Test that an unreachable Redis does not fail the request."""
+        await create_category_in_db(db_session, name="Tools", slug="tools")
+        mock_redis_client.get = AsyncMock(side_effect=RedisConnectionError())
+        mock_redis_client.set = AsyncMock(side_effect=RedisConnectionError())
+
+        response = await test_client.get("/api/search/filters")
+
+        assert response.status_code == 200
+        assert [c["slug"] for c in response.json()["categories"]] == ["tools"]
@@ -0,0 +1,82 @@
+"""Tests for CacheService.
+
+This module contains unit tests for the CacheService, covering
+cache reads, writes, and prefix invalidation against a mocked Redis.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services.cache_service import CacheService
+
+
+class TestCacheKeys:
+    """Tests for CacheService key builders."""
+
+    def test_facets_key_defaults_to_all(self):
+        """Test that unscoped facets share a single key."""
+        assert CacheService.facets_key() == "facets:all"
+        assert CacheService.facets_key(3) == "facets:3"
+
+    def test_facets_key_keeps_category_zero_distinct(self):
+        """Test that category 0 does not share the unscoped key."""
+        assert CacheService.facets_key(0) == "facets:0"
+
+
+class TestGetJson:
+    """Tests for CacheService.get_json method."""
+
+    async def test_get_json_decodes_hit(self, mock_redis_client: MagicMock):
+        """Test that a cached value is decoded from JSON."""
+        mock_redis_client.get = AsyncMock(return_value=json.dumps([{"sku": "A"}]))
+
+        cache = CacheService(mock_redis_client)
+
+        assert await cache.get_json("featured:10") == [{"sku": "A"}]
+
+    async def test_get_json_treats_redis_error_as_miss(
+        self, mock_redis_client: MagicMock
+    ):
+        """Test that an unreachable Redis degrades to a cache miss."""
+        mock_redis_client.get = AsyncMock(side_effect=RedisConnectionError())
+
+        cache = CacheService(mock_redis_client)
+
+        assert await cache.get_json("featured:10") is None
+
+
+class TestSetJson:
+    """Tests for CacheService.set_json method."""
+
+    async def test_set_json_sets_ttl(self, mock_redis_client: MagicMock):
+        """Test that values are written with the default expiry."""
+        cache = CacheService(mock_redis_client)
+
+        await cache.set_json("facets:all", {"categories": []})
+
+        mock_redis_client.set.assert_awaited_once_with(
+            "facets:all",
+            json.dumps({"categories": []}),
+            ex=CacheService.DEFAULT_TTL_SECONDS,
+        )
+
+
+class TestInvalidate:
+    """Tests for CacheService.invalidate method."""
+
+    async def test_invalidate_deletes_matching_keys(self, mock_redis_client: MagicMock):
+        """Test that every key under the given prefixes is deleted."""
+
+        async def scan_iter(match: str):
+            for key in ("featured:10", "featured:20"):
+                if key.startswith(match.rstrip("*")):
+                    yield key
+
+        mock_redis_client.scan_iter = MagicMock(side_effect=scan_iter)
+        cache = CacheService(mock_redis_client)
+
+        await cache.invalidate(CacheService.FEATURED_PREFIX, CacheService.FACETS_PREFIX)
+
+        mock_redis_client.delete.assert_awaited_once_with("featured:10", "featured:20")
@@ -9,9 +9,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.category_service import CategoryService
 from tests.factories import (
+    bulk_link_products,
+    create_category_chain_in_db,
     create_category_in_db,
-    create_product_category,
-    create_product_in_db,
+    create_products_in_db,
+    create_products_in_category,
 )
 
 
@@ -65,8 +67,10 @@ class TestGetCategoryBySlug:
         # Assert - should not find it (case sensitive)
         assert result is None
 
-    async def test_get_category_by_slug_loads_children(self, db_session: AsyncSession):
-        """Test that get_category_by_slug eagerly loads children."""
+    async def test_get_category_by_slug_loads_children(
+        self, db_session: AsyncSession, query_counter: list[str]
+    ):
+        """Test that get_category_by_slug loads children with one extra query."""
         parent = await create_category_in_db(
             db_session,
             name="Tools",
@@ -86,12 +90,17 @@ class TestGetCategoryBySlug:
             parent_id=parent.id,
         )
 
+        # Start from an empty identity map so nothing is served from memory
+        db_session.expunge_all()
+        query_counter.clear()
         service = CategoryService(db_session)
 
         result = await service.get_category_by_slug("tools")
 
         assert result is not None
         assert len(result.children) == 2
+        # One SELECT for the category and one IN query for its children
+        assert len(query_counter) == 2
         child_slugs = [c.slug for c in result.children]
         assert "hand-tools" in child_slugs
         assert "power-tools" in child_slugs
@@ -130,17 +139,8 @@ class TestGetCategoryById:
 
     async def test_get_category_by_id_loads_children(self, db_session: AsyncSession):
         """Test that get_category_by_id eagerly loads children."""
-        parent = await create_category_in_db(
-            db_session,
-            name="Fasteners",
-            slug="fasteners",
-        )
-
-        await create_category_in_db(
-            db_session,
-            name="Bolts",
-            slug="bolts",
-            parent_id=parent.id,
+        parent, _ = await create_category_chain_in_db(
+            db_session, [("Fasteners", "fasteners"), ("Bolts", "bolts")]
         )
 
         service = CategoryService(db_session)
@@ -208,11 +208,8 @@ class TestListCategories:
         self, db_session: AsyncSession
     ):
         """Test that list_categories with root_only=True excludes child categories."""
-        parent = await create_category_in_db(
-            db_session, name="Parent", slug="parent-cat"
-        )
-        await create_category_in_db(
-            db_session, name="Child", slug="child-cat", parent_id=parent.id
+        await create_category_chain_in_db(
+            db_session, [("Parent", "parent-cat"), ("Child", "child-cat")]
         )
 
         service = CategoryService(db_session)
@@ -283,8 +280,10 @@ class TestGetCategoryTree:
         assert "root-2" in root_slugs
         assert "child-1" not in root_slugs
 
-    async def test_get_category_tree_has_children_loaded(self, db_session: AsyncSession):
-        """Test that get_category_tree returns categories with children loaded."""
+    async def test_get_category_tree_has_children_loaded(
+        self, db_session: AsyncSession, query_counter: list[str]
+    ):
+        """Test that get_category_tree loads each tree level with a single query."""
         root = await create_category_in_db(
             db_session, name="Root", slug="root"
         )
@@ -295,6 +294,8 @@ class TestGetCategoryTree:
             db_session, name="Child B", slug="child-b", parent_id=root.id
         )
 
+        db_session.expunge_all()
+        query_counter.clear()
         service = CategoryService(db_session)
 
         tree = await service.get_category_tree()
@@ -305,6 +306,24 @@ class TestGetCategoryTree:
         child_slugs = [c.slug for c in root_category.children]
         assert "child-a" in child_slugs
         assert "child-b" in child_slugs
+        # Roots, children, then an empty grandchildren lookup, not one per category
+        assert len(query_counter) == 3
+
+    async def test_get_category_tree_loads_nested_levels(self, db_session: AsyncSession):
+        """Test that get_category_tree loads grandchildren under their parents."""
+        await create_category_chain_in_db(
+            db_session,
+            [("Level 1", "level-1"), ("Level 2", "level-2"), ("Level 3", "level-3")],
+        )
+
+        service = CategoryService(db_session)
+
+        tree = await service.get_category_tree()
+
+        assert [c.slug for c in tree] == ["level-1"]
+        level2 = tree[0].children[0]
+        assert level2.slug == "level-2"
+        assert [c.slug for c in level2.children] == ["level-3"]
 
     async def test_get_category_tree_excludes_inactive(self, db_session: AsyncSession):
         """Test that get_category_tree excludes inactive categories."""
@@ -337,26 +356,22 @@ class TestGetCategoryWithProducts:
     """Tests for CategoryService.get_category_with_products method."""
 
     async def test_get_category_with_products_returns_category_and_products(
-        self, db_session: AsyncSession
+        self, db_session: AsyncSession, query_counter: list[str]
     ):
         """Test that get_category_with_products returns category and its products."""
         category = await create_category_in_db(
             db_session, name="Tools", slug="tools"
         )
-        product1 = await create_product_in_db(
-            db_session, sku="TOOL-001", name="Hammer"
-        )
-        product2 = await create_product_in_db(
-            db_session, sku="TOOL-002", name="Screwdriver"
+        product1, product2 = await create_products_in_db(
+            db_session,
+            [{"sku": "TOOL-001", "name": "Hammer"}, {"sku": "TOOL-002", "name": "Screwdriver"}],
         )
 
         # Associate products with category
-        pc1 = create_product_category(product1.id, category.id)
-        pc2 = create_product_category(product2.id, category.id)
-        db_session.add(pc1)
-        db_session.add(pc2)
-        await db_session.commit()
+        await bulk_link_products(db_session, category.id, [product1.id, product2.id])
 
+        db_session.expunge_all()
+        query_counter.clear()
         service = CategoryService(db_session)
 
         result_category, products, total = await service.get_category_with_products(
@@ -367,6 +382,8 @@ class TestGetCategoryWithProducts:
         assert result_category.slug == "tools"
         assert len(products) == 2
         assert total == 2
+        # Category, its children, the count and one page of products
+        assert len(query_counter) == 4
         product_skus = [p.sku for p in products]
         assert "TOOL-001" in product_skus
         assert "TOOL-002" in product_skus
@@ -392,19 +409,18 @@ class TestGetCategoryWithProducts:
         category = await create_category_in_db(
             db_session, name="Tools", slug="tools"
         )
-        active_product = await create_product_in_db(
-            db_session, sku="ACTIVE-001", name="Active Tool", is_active=True
-        )
-        inactive_product = await create_product_in_db(
-            db_session, sku="INACTIVE-001", name="Inactive Tool", is_active=False
+        active_product, inactive_product = await create_products_in_db(
+            db_session,
+            [
+                {"sku": "ACTIVE-001", "name": "Active Tool", "is_active": True},
+                {"sku": "INACTIVE-001", "name": "Inactive Tool", "is_active": False},
+            ],
         )
 
         # Associate products with category
-        pc1 = create_product_category(active_product.id, category.id)
-        pc2 = create_product_category(inactive_product.id, category.id)
-        db_session.add(pc1)
-        db_session.add(pc2)
-        await db_session.commit()
+        await bulk_link_products(
+            db_session, category.id, [active_product.id, inactive_product.id]
+        )
 
         service = CategoryService(db_session)
 
@@ -424,13 +440,7 @@ class TestGetCategoryWithProducts:
         )
 
         # Create 5 products
-        for i in range(5):
-            product = await create_product_in_db(
-                db_session, sku=f"PROD-{i:03d}", name=f"Product {i:03d}"
-            )
-            pc = create_product_category(product.id, category.id)
-            db_session.add(pc)
-        await db_session.commit()
+        await create_products_in_category(db_session, category.id, 5, "PROD-")
 
         service = CategoryService(db_session)
 
@@ -483,20 +493,16 @@ class TestGetCategoryWithProducts:
         )
 
         # Create products with different names
-        product_z = await create_product_in_db(
-            db_session, sku="PROD-Z", name="Zebra Tool"
-        )
-        product_a = await create_product_in_db(
-            db_session, sku="PROD-A", name="Alpha Tool"
-        )
-        product_m = await create_product_in_db(
-            db_session, sku="PROD-M", name="Middle Tool"
+        products = await create_products_in_db(
+            db_session,
+            [
+                {"sku": "PROD-Z", "name": "Zebra Tool"},
+                {"sku": "PROD-A", "name": "Alpha Tool"},
+                {"sku": "PROD-M", "name": "Middle Tool"},
+            ],
         )
 
-        for product in [product_z, product_a, product_m]:
-            pc = create_product_category(product.id, category.id)
-            db_session.add(pc)
-        await db_session.commit()
+        await bulk_link_products(db_session, category.id, [p.id for p in products])
 
         service = CategoryService(db_session)
 
@@ -684,13 +690,7 @@ class TestGetProductCount:
         )
 
         # Create 3 products and associate them with the category
-        for i in range(3):
-            product = await create_product_in_db(
-                db_session, sku=f"COUNT-{i:03d}", name=f"Product {i}"
-            )
-            pc = create_product_category(product.id, category.id)
-            db_session.add(pc)
-        await db_session.commit()
+        await create_products_in_category(db_session, category.id, 3, "COUNT-")
 
         service = CategoryService(db_session)
 
@@ -730,18 +730,17 @@ class TestGetProductCount:
             db_session, name="Mixed Category", slug="mixed-category"
         )
 
-        active_product = await create_product_in_db(
-            db_session, sku="ACTIVE-001", name="Active Product", is_active=True
-        )
-        inactive_product = await create_product_in_db(
-            db_session, sku="INACTIVE-001", name="Inactive Product", is_active=False
+        active_product, inactive_product = await create_products_in_db(
+            db_session,
+            [
+                {"sku": "ACTIVE-001", "name": "Active Product", "is_active": True},
+                {"sku": "INACTIVE-001", "name": "Inactive Product", "is_active": False},
+            ],
         )
 
-        pc1 = create_product_category(active_product.id, category.id)
-        pc2 = create_product_category(inactive_product.id, category.id)
-        db_session.add(pc1)
-        db_session.add(pc2)
-        await db_session.commit()
+        await bulk_link_products(
+            db_session, category.id, [active_product.id, inactive_product.id]
+        )
 
         service = CategoryService(db_session)
 
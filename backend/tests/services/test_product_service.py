@@ -5,13 +5,17 @@ product retrieval, listing, filtering, and CRUD operations.
 """
 
 import pytest
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.product_service import ProductService
 from tests.factories import (
+    bulk_link_product_categories,
+    bulk_link_products,
+    create_categories_in_db,
     create_category_in_db,
-    create_product_category,
     create_product_in_db,
+    create_products_in_db,
 )
 
 
@@ -65,6 +69,49 @@ class TestGetProductBySku:
         # Assert - should not find it (case sensitive)
         assert result is None
 
+    async def test_get_product_by_sku_does_not_load_categories(self, db_session: AsyncSession):
+        """Test that the plain lookup leaves the categories relationship unloaded."""
+        await create_product_in_db(db_session, sku="LAZY-001", name="Lazy Product")
+        db_session.expunge_all()
+
+        service = ProductService(db_session)
+
+        result = await service.get_product_by_sku("LAZY-001")
+
+        assert result is not None
+        assert "categories" in inspect(result).unloaded
+
+    async def test_get_product_by_sku_with_categories_loads_categories(
+        self, db_session: AsyncSession
+    ):
+        """Test that the detail lookup eagerly loads categories."""
+        category = await create_category_in_db(db_session, name="Tools", slug="tools")
+        product = await create_product_in_db(db_session, sku="DETAIL-001", name="Detail")
+        await bulk_link_products(db_session, category.id, [product.id])
+        db_session.expunge_all()
+
+        service = ProductService(db_session)
+
+        result = await service.get_product_by_sku_with_categories("DETAIL-001")
+
+        assert result is not None
+        assert [c.slug for c in result.categories] == ["tools"]
+
+    async def test_get_product_by_sku_binds_each_call_sku(self, db_session: AsyncSession):
+        """Test that the cached lookup statement binds the SKU of every call."""
+        await create_products_in_db(
+            db_session,
+            [{"sku": "CACHE-001", "name": "First"}, {"sku": "CACHE-002", "name": "Second"}],
+        )
+
+        service = ProductService(db_session)
+
+        first = await service.get_product_by_sku("CACHE-001")
+        second = await service.get_product_by_sku("CACHE-002")
+
+        assert first is not None and first.name == "First"
+        assert second is not None and second.name == "Second"
+
 
 class TestGetProductById:
     """Tests for ProductService.get_product_by_id method."""
@@ -96,6 +143,18 @@ class TestGetProductById:
 
         assert result is None
 
+    async def test_get_product_by_id_binds_each_call_id(self, db_session: AsyncSession):
+        """Test that the cached lookup statement binds the ID of every call."""
+        first, second = await create_products_in_db(
+            db_session,
+            [{"sku": "CACHE-ID-001", "name": "First"}, {"sku": "CACHE-ID-002", "name": "Second"}],
+        )
+
+        service = ProductService(db_session)
+
+        assert (await service.get_product_by_id(first.id)).sku == "CACHE-ID-001"
+        assert (await service.get_product_by_id(second.id)).sku == "CACHE-ID-002"
+
 
 class TestListProducts:
     """Tests for ProductService.list_products method."""
@@ -105,9 +164,14 @@ class TestListProducts:
     ):
         """Test that list_products returns all active products by default."""
         # Create multiple products
-        await create_product_in_db(db_session, sku="PROD-001", name="Product A")
-        await create_product_in_db(db_session, sku="PROD-002", name="Product B")
-        await create_product_in_db(db_session, sku="PROD-003", name="Product C")
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": "PROD-001", "name": "Product A"},
+                {"sku": "PROD-002", "name": "Product B"},
+                {"sku": "PROD-003", "name": "Product C"},
+            ],
+        )
 
         service = ProductService(db_session)
 
@@ -120,11 +184,12 @@ class TestListProducts:
         self, db_session: AsyncSession
     ):
         """Test that list_products excludes inactive products by default."""
-        await create_product_in_db(
-            db_session, sku="ACTIVE-001", name="Active Product", is_active=True
-        )
-        await create_product_in_db(
-            db_session, sku="INACTIVE-001", name="Inactive Product", is_active=False
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": "ACTIVE-001", "name": "Active Product", "is_active": True},
+                {"sku": "INACTIVE-001", "name": "Inactive Product", "is_active": False},
+            ],
         )
 
         service = ProductService(db_session)
@@ -138,11 +203,12 @@ class TestListProducts:
         self, db_session: AsyncSession
     ):
         """Test that list_products includes inactive products when active_only=False."""
-        await create_product_in_db(
-            db_session, sku="ACTIVE-001", name="Active Product", is_active=True
-        )
-        await create_product_in_db(
-            db_session, sku="INACTIVE-001", name="Inactive Product", is_active=False
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": "ACTIVE-001", "name": "Active Product", "is_active": True},
+                {"sku": "INACTIVE-001", "name": "Inactive Product", "is_active": False},
+            ],
         )
 
         service = ProductService(db_session)
@@ -155,10 +221,9 @@ class TestListProducts:
     async def test_list_products_pagination(self, db_session: AsyncSession):
         """Test that list_products correctly handles pagination."""
         # Create 5 products
-        for i in range(5):
-            await create_product_in_db(
-                db_session, sku=f"PROD-{i:03d}", name=f"Product {i}"
-            )
+        await create_products_in_db(
+            db_session, [{"sku": f"PROD-{i:03d}", "name": f"Product {i}"} for i in range(5)]
+        )
 
         service = ProductService(db_session)
 
@@ -190,11 +255,12 @@ class TestListProducts:
 
     async def test_list_products_filters_by_featured(self, db_session: AsyncSession):
         """Test that list_products filters by featured flag."""
-        await create_product_in_db(
-            db_session, sku="FEATURED-001", name="Featured", is_featured=True
-        )
-        await create_product_in_db(
-            db_session, sku="NORMAL-001", name="Normal", is_featured=False
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": "FEATURED-001", "name": "Featured", "is_featured": True},
+                {"sku": "NORMAL-001", "name": "Normal", "is_featured": False},
+            ],
         )
 
         service = ProductService(db_session)
@@ -207,27 +273,24 @@ class TestListProducts:
     async def test_list_products_filters_by_category(self, db_session: AsyncSession):
         """Test that list_products filters by category."""
         # Create categories
-        category1 = await create_category_in_db(
-            db_session, name="Tools", slug="tools"
-        )
-        category2 = await create_category_in_db(
-            db_session, name="Hardware", slug="hardware"
+        category1, category2 = await create_categories_in_db(
+            db_session,
+            [{"name": "Tools", "slug": "tools"}, {"name": "Hardware", "slug": "hardware"}],
         )
 
         # Create products
-        product1 = await create_product_in_db(
-            db_session, sku="TOOL-001", name="Tool Product"
-        )
-        product2 = await create_product_in_db(
-            db_session, sku="HARDWARE-001", name="Hardware Product"
+        product1, product2 = await create_products_in_db(
+            db_session,
+            [
+                {"sku": "TOOL-001", "name": "Tool Product"},
+                {"sku": "HARDWARE-001", "name": "Hardware Product"},
+            ],
         )
 
         # Associate products with categories
-        product_cat1 = create_product_category(product1.id, category1.id)
-        product_cat2 = create_product_category(product2.id, category2.id)
-        db_session.add(product_cat1)
-        db_session.add(product_cat2)
-        await db_session.commit()
+        await bulk_link_product_categories(
+            db_session, [(product1.id, category1.id), (product2.id, category2.id)]
+        )
 
         service = ProductService(db_session)
 
@@ -239,9 +302,14 @@ class TestListProducts:
 
     async def test_list_products_orders_by_name(self, db_session: AsyncSession):
         """Test that list_products returns products ordered by name."""
-        await create_product_in_db(db_session, sku="PROD-C", name="Zebra Product")
-        await create_product_in_db(db_session, sku="PROD-A", name="Alpha Product")
-        await create_product_in_db(db_session, sku="PROD-B", name="Beta Product")
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": "PROD-C", "name": "Zebra Product"},
+                {"sku": "PROD-A", "name": "Alpha Product"},
+                {"sku": "PROD-B", "name": "Beta Product"},
+            ],
+        )
 
         service = ProductService(db_session)
 
@@ -259,26 +327,18 @@ class TestGetFeaturedProducts:
         self, db_session: AsyncSession
     ):
         """Test that get_featured_products returns only featured and active products."""
-        await create_product_in_db(
-            db_session,
-            sku="FEATURED-ACTIVE",
-            name="Featured Active",
-            is_featured=True,
-            is_active=True,
-        )
-        await create_product_in_db(
+        await create_products_in_db(
             db_session,
-            sku="FEATURED-INACTIVE",
-            name="Featured Inactive",
-            is_featured=True,
-            is_active=False,
-        )
-        await create_product_in_db(
-            db_session,
-            sku="NORMAL-ACTIVE",
-            name="Normal Active",
-            is_featured=False,
-            is_active=True,
+            [
+                {"sku": "FEATURED-ACTIVE", "name": "Featured Active", "is_featured": True},
+                {
+                    "sku": "FEATURED-INACTIVE",
+                    "name": "Featured Inactive",
+                    "is_featured": True,
+                    "is_active": False,
+                },
+                {"sku": "NORMAL-ACTIVE", "name": "Normal Active", "is_featured": False},
+            ],
         )
 
         service = ProductService(db_session)
@@ -291,13 +351,13 @@ class TestGetFeaturedProducts:
     async def test_get_featured_respects_limit(self, db_session: AsyncSession):
         """Test that get_featured_products respects the limit parameter."""
         # Create 5 featured products
-        for i in range(5):
-            await create_product_in_db(
-                db_session,
-                sku=f"FEATURED-{i:03d}",
-                name=f"Featured {i}",
-                is_featured=True,
-            )
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": f"FEATURED-{i:03d}", "name": f"Featured {i}", "is_featured": True}
+                for i in range(5)
+            ],
+        )
 
         service = ProductService(db_session)
 
@@ -305,6 +365,21 @@ class TestGetFeaturedProducts:
 
         assert len(products) == 3
 
+    async def test_get_featured_binds_each_call_limit(self, db_session: AsyncSession):
+        """Test that the cached statement applies the limit of every call."""
+        await create_products_in_db(
+            db_session,
+            [
+                {"sku": f"FEATURED-{i:03d}", "name": f"Featured {i}", "is_featured": True}
+                for i in range(5)
+            ],
+        )
+
+        service = ProductService(db_session)
+
+        assert len(await service.get_featured_products(limit=2)) == 2
+        assert len(await service.get_featured_products(limit=4)) == 4
+
     async def test_get_featured_returns_empty_when_none_exist(
         self, db_session: AsyncSession
     ):
@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import MagicMock, patch
 
+from qdrant_client.http.exceptions import UnexpectedResponse
+
 
 class TestQdrantService:
     """Test cases for QdrantService."""
@@ -15,10 +17,13 @@ class TestQdrantService:
         mock_client.collection_exists.return_value = False
 
         service = QdrantService(client=mock_client)
-        service.ensure_collection()
+
+        assert service.ensure_collection() is True
 
         mock_client.collection_exists.assert_called_once_with("products")
         mock_client.create_collection.assert_called_once()
+        quantization = mock_client.create_collection.call_args.kwargs["quantization_config"]
+        assert quantization.scalar.type == "int8"
 
     def test_ensure_collection_skips_if_exists(self):
         """Test collection not recreated if exists."""
@@ -28,11 +33,58 @@ class TestQdrantService:
         mock_client.collection_exists.return_value = True
 
         service = QdrantService(client=mock_client)
-        service.ensure_collection()
+
+        assert service.ensure_collection() is False
 
         mock_client.collection_exists.assert_called_once()
         mock_client.create_collection.assert_not_called()
 
+    def test_ensure_collection_tolerates_concurrent_creation(self):
+        """Test that losing the creation race to another worker is not an error."""
+        from app.services.qdrant_service import QdrantService
+
+        mock_client = MagicMock()
+        mock_client.collection_exists.side_effect = [False, True]
+        mock_client.create_collection.side_effect = UnexpectedResponse(
+            409, "Conflict", b"already exists", {}
+        )
+
+        service = QdrantService(client=mock_client)
+
+        assert service.ensure_collection() is False
+
+    def test_ensure_collection_reraises_other_errors(self):
+        """Test that a failed create is raised when the collection still doesn't exist."""
+        from app.services.qdrant_service import QdrantService
+
+        mock_client = MagicMock()
+        mock_client.collection_exists.return_value = False
+        mock_client.create_collection.side_effect = UnexpectedResponse(
+            500, "Internal Server Error", b"", {}
+        )
+
+        service = QdrantService(client=mock_client)
+
+        with pytest.raises(UnexpectedResponse):
+            service.ensure_collection()
+
+    def test_get_embedding_hashes_maps_stored_hashes_by_sku(self):
+        """Test that stored hashes are returned per SKU, skipping points without one."""
+        from app.services.qdrant_service import QdrantService
+
+        mock_client = MagicMock()
+        mock_client.retrieve.return_value = [
+            MagicMock(payload={"sku": "SKU-001", "embedding_hash": "abc"}),
+            MagicMock(payload={"sku": "SKU-002"}),
+        ]
+
+        service = QdrantService(client=mock_client)
+
+        hashes = service.get_embedding_hashes(["SKU-001", "SKU-002", "SKU-003"])
+
+        assert hashes == {"SKU-001": "abc"}
+        assert len(mock_client.retrieve.call_args.kwargs["ids"]) == 3
+
     def test_upsert_product_vector(self):
         """Test upserting a product vector."""
         from app.services.qdrant_service import QdrantService
@@ -48,6 +100,23 @@ class TestQdrantService:
 
         mock_client.upsert.assert_called_once()
 
+    def test_upsert_products_batch_chunks_and_waits_on_last(self):
+        """Test bulk upsert splits points and only waits on the final chunk."""
+        from app.services.qdrant_service import QdrantService
+
+        mock_client = MagicMock()
+        service = QdrantService(client=mock_client)
+
+        service.upsert_products_batch(
+            [(f"SKU-{i}", [0.1] * 384, {"price": 1.0}) for i in range(5)],
+            batch_size=2,
+        )
+
+        calls = mock_client.upsert.call_args_list
+        assert [len(c.kwargs["points"]) for c in calls] == [2, 2, 1]
+        assert [c.kwargs["wait"] for c in calls] == [False, False, True]
+        assert calls[0].kwargs["points"][0].payload == {"price": 1.0, "sku": "SKU-0"}
+
     def test_search_returns_results(self):
         """Test vector search returns SKUs with scores."""
         from app.services.qdrant_service import QdrantService
@@ -75,3 +144,30 @@ class TestQdrantService:
         service.delete_product("TEST-001")
 
         mock_client.delete.assert_called_once()
+
+    def test_delete_products_batch_sends_one_request(self):
+        """Test that batch deletion removes all SKUs in one call."""
+        from app.services.qdrant_service import QdrantService
+
+        mock_client = MagicMock()
+        service = QdrantService(client=mock_client)
+
+        service.delete_products_batch(["SKU-001", "SKU-002"])
+
+        mock_client.delete.assert_called_once()
+        selector = mock_client.delete.call_args.kwargs["points_selector"]
+        assert selector.points == [
+            service._sku_to_point_id("SKU-001"),
+            service._sku_to_point_id("SKU-002"),
+        ]
+
+    def test_delete_products_batch_skips_empty(self):
+        """Test that no request is sent when there is nothing to delete."""
+        from app.services.qdrant_service import QdrantService
+
+        mock_client = MagicMock()
+        service = QdrantService(client=mock_client)
+
+        service.delete_products_batch([])
+
+        mock_client.delete.assert_not_called()
@@ -1,13 +1,11 @@
 """Tests for SearchService semantic search."""
 
-import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 
 
 class TestSemanticSearch:
     """Tests for semantic search functionality."""
 
-    @pytest.mark.asyncio
     async def test_semantic_search_uses_qdrant_when_available(self):
         """Test that semantic search queries Qdrant and returns products."""
         from app.services.search_service import SearchService
@@ -59,7 +57,6 @@ class TestSemanticSearch:
             assert results[0][0].sku == "TEST-001"
             assert results[0][1] == 0.95
 
-    @pytest.mark.asyncio
     async def test_semantic_search_returns_empty_when_qdrant_returns_no_results(self):
         """Test that semantic search returns empty list when Qdrant has no matches."""
         from app.services.search_service import SearchService
@@ -87,7 +84,6 @@ class TestSemanticSearch:
             assert len(results) == 0
             assert total == 0
 
-    @pytest.mark.asyncio
     async def test_search_falls_back_to_keyword_on_qdrant_error(self):
         """Test fallback to keyword search when Qdrant fails."""
         from app.services.search_service import SearchService
@@ -107,7 +103,6 @@ class TestSemanticSearch:
 
             mock_keyword.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_semantic_search_applies_category_filter(self):
         """Test that semantic search passes category filter to Qdrant."""
         from app.services.search_service import SearchService
@@ -138,7 +133,6 @@ class TestSemanticSearch:
             call_kwargs = mock_qdrant_svc.search.call_args.kwargs
             assert call_kwargs["category_ids"] == [5]
 
-    @pytest.mark.asyncio
     async def test_semantic_search_applies_price_filters(self):
         """Test that semantic search passes price filters to Qdrant."""
         from app.services.search_service import SearchService
@@ -169,3 +163,16 @@ class TestSemanticSearch:
             call_kwargs = mock_qdrant_svc.search.call_args.kwargs
             assert call_kwargs["price_min"] == 10.0
             assert call_kwargs["price_max"] == 100.0
+
+    async def test_product_lookup_binds_skus_in_hit_order(self):
+        """Test that the SKU IN list is deduplicated in a stable, hit-ordered way."""
+        from app.services.search_service import SearchService
+
+        mock_db = MagicMock()
+        mock_db.execute = AsyncMock(return_value=MagicMock())
+
+        service = SearchService(mock_db)
+        await service._get_active_products_by_sku(["SKU-003", "SKU-001", "SKU-003", "SKU-002"])
+
+        statement = mock_db.execute.await_args.args[0]
+        assert statement.compile().params["sku_1"] == ["SKU-003", "SKU-001", "SKU-002"]
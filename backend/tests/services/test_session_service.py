@@ -0,0 +1,125 @@
+"""Tests for SessionService business logic.
+
+This module contains unit tests for the SessionService, covering
+session lookup and activity tracking.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import UserSession
+from app.services.session_service import SessionService
+from tests.factories import create_session_in_db
+
+
+async def _stored_last_active_at(db_session: AsyncSession, session_db_id: int) -> datetime:
+    """Read last_active_at straight from the database."""
+    result = await db_session.execute(
+        select(UserSession.last_active_at).where(UserSession.id == session_db_id)
+    )
+    return result.scalar_one().replace(tzinfo=None)
+
+
+class TestGetSession:
+    """Tests for SessionService session lookups."""
+
+    async def test_get_session_binds_each_call_session_id(self, db_session: AsyncSession):
+        """Test that the cached lookup statement binds the session_id of every call."""
+        first = await create_session_in_db(db_session)
+        second = await create_session_in_db(db_session)
+
+        service = SessionService(db_session)
+
+        assert (await service.get_session(first.session_id)).id == first.id
+        assert (await service.get_session(second.session_id)).id == second.id
+
+    async def test_get_session_by_db_id_binds_each_call_id(self, db_session: AsyncSession):
+        """Test that the cached lookup statement binds the ID of every call."""
+        first = await create_session_in_db(db_session)
+        second = await create_session_in_db(db_session)
+
+        service = SessionService(db_session)
+
+        assert (await service.get_session_by_db_id(first.id)).session_id == first.session_id
+        assert (await service.get_session_by_db_id(second.id)).session_id == second.session_id
+
+
+class TestTouchSession:
+    """Tests for SessionService.touch_session method."""
+
+    async def test_touch_session_updates_stale_session(self, db_session: AsyncSession):
+        """Test that a session idle longer than the interval is bumped."""
+        stale = datetime.now(timezone.utc) - timedelta(minutes=10)
+        user_session = await create_session_in_db(db_session, last_active_at=stale)
+
+        service = SessionService(db_session)
+        await service.touch_session(user_session)
+
+        assert await _stored_last_active_at(db_session, user_session.id) > stale.replace(
+            tzinfo=None
+        )
+
+    async def test_touch_session_refreshes_returned_instance(self, db_session: AsyncSession):
+        """Test that the caller's instance reflects the new activity and expiry."""
+        stale = datetime.now(timezone.utc) - timedelta(minutes=10)
+        old_expiry = stale + timedelta(days=SessionService.SESSION_TIMEOUT_DAYS)
+        user_session = await create_session_in_db(
+            db_session, last_active_at=stale, expires_at=old_expiry
+        )
+
+        service = SessionService(db_session)
+        await service.touch_session(user_session)
+
+        assert user_session.last_active_at > stale
+        assert user_session.expires_at > old_expiry
+        assert user_session not in db_session.dirty
+
+    async def test_touch_session_skips_recently_active_session(
+        self, db_session: AsyncSession
+    ):
+        """Test that a session touched within the interval is not rewritten."""
+        recent = datetime.now(timezone.utc) - timedelta(seconds=5)
+        user_session = await create_session_in_db(db_session, last_active_at=recent)
+
+        service = SessionService(db_session)
+        await service.touch_session(user_session)
+
+        assert await _stored_last_active_at(db_session, user_session.id) == recent.replace(
+            tzinfo=None
+        )
+
+
+class TestDeleteSession:
+    """Tests for SessionService.delete_session method."""
+
+    async def test_delete_session_removes_row(self, db_session: AsyncSession):
+        """Test that an existing session is deleted."""
+        user_session = await create_session_in_db(db_session)
+
+        service = SessionService(db_session)
+
+        assert await service.delete_session(user_session.session_id) is True
+        assert await service.get_session_by_db_id(user_session.id) is None
+
+    async def test_delete_session_returns_false_when_missing(
+        self, db_session: AsyncSession
+    ):
+        """Test that deleting an unknown session reports nothing was removed."""
+        service = SessionService(db_session)
+
+        assert await service.delete_session("does-not-exist") is False
+
+    async def test_delete_session_returns_false_when_expired(
+        self, db_session: AsyncSession
+    ):
+        """Test that an expired session is treated as missing and left in place."""
+        user_session = await create_session_in_db(
+            db_session, expires_at=datetime.now(timezone.utc) - timedelta(days=1)
+        )
+
+        service = SessionService(db_session)
+
+        assert await service.delete_session(user_session.session_id) is False
+        assert await service.get_session_by_db_id(user_session.id) is not None
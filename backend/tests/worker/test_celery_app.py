@@ -0,0 +1,46 @@
+"""Tests for Celery application configuration."""
+
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from app.worker.celery_app import celery_app, init_worker_process
+
+
+class TestCeleryConfig:
+    """Tests for celery_app configuration."""
+
+    def test_routed_queues_are_declared(self):
+        """Test that every routed queue is declared alongside the default queue."""
+        declared = {queue.name for queue in celery_app.conf.task_queues}
+        routed = {route["queue"] for route in celery_app.conf.task_routes.values()}
+
+        assert celery_app.conf.task_default_queue in declared
+        assert routed <= declared
+
+
+class TestInitWorkerProcess:
+    """Tests for the worker_process_init warmup handler."""
+
+    def test_warmup_loads_model_without_touching_qdrant(self):
+        """Test that warmup loads the model and makes no Qdrant network calls."""
+        with (
+            patch("app.services.embedding_service.get_embedding_service") as mock_get_emb,
+            patch("app.services.qdrant_service.QdrantService") as mock_qdrant_cls,
+            patch("app.services.qdrant_service.get_qdrant_client"),
+        ):
+            init_worker_process()
+
+        assert mock_get_emb.called
+        mock_qdrant_cls.assert_not_called()
+
+    def test_warmup_failure_is_logged_not_raised(self):
+        """Test that a failed model load does not kill the child process."""
+        service = MagicMock()
+        type(service).model = PropertyMock(side_effect=OSError("offline"))
+
+        with (
+            patch("app.services.embedding_service.get_embedding_service", return_value=service),
+            patch("app.worker.celery_app.logger") as mock_logger,
+        ):
+            init_worker_process()
+
+        mock_logger.warning.assert_called_once()
@@ -1,13 +1,81 @@
 """Tests for Celery tasks."""
 
 import json
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.models import Base
+from app.worker.tasks import (
+    _embedding_hash,
+    _iter_product_batches,
+    _upsert_products,
+    cleanup_stale_vectors,
+    sync_product_data,
+    update_product_embeddings,
+    update_product_embeddings_batch,
+)
+from tests.factories import create_product
+
+
+@pytest.fixture
+def mock_session() -> Generator[MagicMock, None, None]:
+    """Patch the tasks' sync DB session and yield the session they will use."""
+    with patch("app.worker.tasks.get_sync_db_session") as mock_get_db:
+        session = MagicMock()
+        mock_get_db.return_value.__enter__ = MagicMock(return_value=session)
+        mock_get_db.return_value.__exit__ = MagicMock(return_value=False)
+        yield session
+
+
+@pytest.fixture
+def sqlite_session() -> Generator[Session, None, None]:
+    """Patch the tasks' sync DB session with a real in-memory SQLite session."""
+    engine = create_engine("sqlite://")
+    try:
+        Base.metadata.create_all(engine)
+        with (
+            Session(engine) as session,
+            patch("app.worker.tasks.get_sync_db_session") as mock_get_db,
+        ):
+            mock_get_db.return_value.__enter__ = MagicMock(return_value=session)
+            mock_get_db.return_value.__exit__ = MagicMock(return_value=False)
+            yield session
+    finally:
+        engine.dispose()
+
+
+@pytest.fixture
+def mock_emb_service() -> Generator[MagicMock, None, None]:
+    """Patch get_embedding_service and yield the service it returns."""
+    with patch("app.worker.tasks.get_embedding_service") as mock_get_emb:
+        service = MagicMock()
+        mock_get_emb.return_value = service
+        yield service
+
+
+@pytest.fixture
+def mock_qdrant() -> Generator[MagicMock, None, None]:
+    """Patch QdrantService and yield the instance tasks construct.
+
+    The collection is reported as already existing, with no stored hashes.
+    """
+    with patch("app.worker.tasks.QdrantService") as mock_qdrant_cls:
+        qdrant = MagicMock()
+        qdrant.ensure_collection.return_value = False
+        qdrant.get_embedding_hashes.return_value = {}
+        mock_qdrant_cls.return_value = qdrant
+        yield qdrant
+
 
 class TestSyncProductDataTask:
     """Tests for sync_product_data task."""
 
-    def test_sync_product_data_parses_json_and_upserts(self, tmp_path):
+    def test_sync_product_data_parses_json_and_upserts(self, tmp_path, mock_session):
         """Test that sync_product_data reads JSON and creates products."""
         # Create test JSON file
         products_data = {
@@ -24,151 +92,314 @@ class TestSyncProductDataTask:
         json_file = tmp_path / "products.json"
         json_file.write_text(json.dumps(products_data))
 
-        with (
-            patch("app.worker.tasks.get_sync_db_session") as mock_get_db,
-            patch("app.worker.tasks.update_product_embeddings"),
-        ):
-            mock_session = MagicMock()
-            mock_get_db.return_value.__enter__ = MagicMock(return_value=mock_session)
-            mock_get_db.return_value.__exit__ = MagicMock(return_value=False)
-
-            # Import inside patch context to use mocked dependencies
-            from app.worker.tasks import sync_product_data  # noqa: PLC0415
-
+        with patch("app.worker.tasks.update_product_embeddings_batch") as mock_batch_task:
             result = sync_product_data(str(json_file))
 
-            assert result["processed"] == 1
-            assert result["skus"] == ["TEST-001"]
-
-
-class TestUpdateProductEmbeddingsTask:
-    """Tests for update_product_embeddings task."""
+        assert result["processed"] == 1
+        assert result["skus"] == ["TEST-001"]
+        mock_batch_task.delay.assert_called_once_with(["TEST-001"])
 
-    def test_update_embeddings_generates_and_upserts(self):
-        """Test embedding generation and Qdrant upsert."""
-        with (
-            patch("app.worker.tasks.get_sync_db_session") as mock_get_db,
-            patch("app.worker.tasks.get_embedding_service") as mock_get_emb,
-            patch("app.worker.tasks.QdrantService") as mock_qdrant_cls,
-        ):
-            # Setup mocks
-            mock_session = MagicMock()
-            mock_get_db.return_value.__enter__ = MagicMock(return_value=mock_session)
-            mock_get_db.return_value.__exit__ = MagicMock(return_value=False)
+    def test_sync_product_data_uses_constant_number_of_statements(
+        self, tmp_path, mock_session
+    ):
+        """Test that syncing N products issues a fixed set of bulk statements."""
+        skus = [f"TEST-{i:03d}" for i in range(25)]
+        products_data = {
+            "products": [
+                {"sku": sku, "name": sku, "price": 1.0, "categories": ["tools"]}
+                for sku in skus
+            ]
+        }
+        json_file = tmp_path / "products.json"
+        json_file.write_text(json.dumps(products_data))
 
-            mock_product = MagicMock()
-            mock_product.sku = "TEST-001"
-            mock_product.name = "Test Product"
-            mock_product.description = "Description"
-            mock_product.short_description = None
-            mock_product.price = 19.99
-            mock_product.categories = []
-            mock_session.execute.return_value.scalar_one_or_none.return_value = mock_product
+        slug_result = MagicMock()
+        slug_result.all.return_value = [("tools", 1)]
+        upsert_result = MagicMock()
+        upsert_result.all.return_value = [(i, sku) for i, sku in enumerate(skus, 1)]
+        mock_session.execute.side_effect = [
+            slug_result,  # category slug map
+            upsert_result,  # INSERT ... ON CONFLICT ... RETURNING
+            MagicMock(),  # DELETE old category links
+            MagicMock(),  # INSERT new category links
+        ]
+
+        with patch("app.worker.tasks.update_product_embeddings_batch"):
+            result = sync_product_data(str(json_file))
 
-            mock_emb_service = MagicMock()
-            mock_emb_service.get_product_text.return_value = "Test Product. Description"
-            mock_emb_service.generate_embedding.return_value = [0.1] * 384
-            mock_get_emb.return_value = mock_emb_service
+        assert result["processed"] == len(skus)
+        assert mock_session.execute.call_count == 4
+        association_rows = mock_session.execute.call_args_list[3].args[1]
+        assert len(association_rows) == len(skus)
+
+    def test_sync_product_data_upsert_preserves_unsynced_columns(self):
+        """Test that the bulk upsert only overwrites columns from the sync file."""
+        session = MagicMock()
+        _upsert_products(
+            session,
+            [
+                {"sku": "TEST-001", "name": "One", "price": 1.0},
+                {"sku": "TEST-002", "name": "Two", "price": 2.0},
+            ],
+        )
+
+        session.execute.assert_called_once()
+        stmt = session.execute.call_args.args[0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        set_clause = sql.split("DO UPDATE SET", 1)[1]
+
+        assert "ON CONFLICT (sku)" in sql
+        assert "name = excluded.name" in set_clause
+        assert "is_featured" not in set_clause
+        assert "RETURNING products.id, products.sku" in sql
+
+    def test_iter_product_batches_streams_fixed_size_batches(self, tmp_path):
+        """Test that the feed is streamed in batches with duplicate SKUs collapsed."""
+        products_data = {
+            "products": [
+                {"sku": "TEST-001", "name": "One", "price": 1.5},
+                {"sku": "TEST-001", "name": "One (updated)", "price": 2.5},
+                {"sku": "TEST-002", "name": "Two", "price": 3.0},
+                {"sku": "TEST-003", "name": "Three", "price": 4.0},
+            ]
+        }
+        json_file = tmp_path / "products.json"
+        json_file.write_text(json.dumps(products_data))
 
-            mock_qdrant = MagicMock()
-            mock_qdrant_cls.return_value = mock_qdrant
+        with json_file.open("rb") as f:
+            batches = list(_iter_product_batches(f, batch_size=2))
 
-            # Import inside patch context to use mocked dependencies
-            from app.worker.tasks import update_product_embeddings  # noqa: PLC0415
+        assert [[p["sku"] for p in batch] for batch in batches] == [
+            ["TEST-001", "TEST-002"],
+            ["TEST-003"],
+        ]
+        assert batches[0][0]["name"] == "One (updated)"
+        assert isinstance(batches[0][0]["price"], float)
 
-            result = update_product_embeddings("TEST-001")
 
-            assert result["sku"] == "TEST-001"
-            assert result["status"] == "updated"
-            mock_qdrant.upsert_product.assert_called_once()
+class TestUpdateProductEmbeddingsTask:
+    """Tests for update_product_embeddings task."""
 
-    def test_update_embeddings_extracts_category_names_and_ids_from_category_objects(self):
+    def test_update_embeddings_generates_and_upserts(
+        self, mock_session, mock_emb_service, mock_qdrant
+    ):
+        """Test embedding generation and Qdrant upsert."""
+        mock_product = MagicMock()
+        mock_product.sku = "TEST-001"
+        mock_product.name = "Test Product"
+        mock_product.description = "Description"
+        mock_product.short_description = None
+        mock_product.price = 19.99
+        mock_product.categories = []
+        mock_session.execute.return_value.scalar_one_or_none.return_value = mock_product
+
+        mock_emb_service.get_product_text.return_value = "Test Product. Description"
+        mock_emb_service.generate_embedding.return_value = [0.1] * 384
+
+        result = update_product_embeddings("TEST-001")
+
+        assert result["sku"] == "TEST-001"
+        assert result["status"] == "updated"
+        mock_qdrant.upsert_product.assert_called_once()
+
+    def test_update_embeddings_extracts_category_names_and_ids_from_category_objects(
+        self, mock_session, mock_emb_service, mock_qdrant
+    ):
         """Test that category names and IDs are correctly extracted from Category objects.
 
         The Product.categories relationship returns Category objects directly (via secondary
         table), not ProductCategory association objects. This test verifies the fix for
         correctly accessing .name and .id attributes on Category objects.
         """
-        with (
-            patch("app.worker.tasks.get_sync_db_session") as mock_get_db,
-            patch("app.worker.tasks.get_embedding_service") as mock_get_emb,
-            patch("app.worker.tasks.QdrantService") as mock_qdrant_cls,
-        ):
-            # Setup mocks
-            mock_session = MagicMock()
-            mock_get_db.return_value.__enter__ = MagicMock(return_value=mock_session)
-            mock_get_db.return_value.__exit__ = MagicMock(return_value=False)
-
-            # Create mock Category objects (not ProductCategory association objects)
-            mock_category_1 = MagicMock()
-            mock_category_1.id = 1
-            mock_category_1.name = "Tools"
-
-            mock_category_2 = MagicMock()
-            mock_category_2.id = 5
-            mock_category_2.name = "Hardware"
-
-            mock_product = MagicMock()
-            mock_product.sku = "TEST-002"
-            mock_product.name = "Power Drill"
-            mock_product.description = "A powerful drill"
-            mock_product.short_description = None
-            mock_product.price = 99.99
-            # product.categories returns Category objects directly
-            mock_product.categories = [mock_category_1, mock_category_2]
-            mock_session.execute.return_value.scalar_one_or_none.return_value = mock_product
-
-            mock_emb_service = MagicMock()
-            mock_emb_service.get_product_text.return_value = "Power Drill. A powerful drill"
-            mock_emb_service.generate_embedding.return_value = [0.1] * 384
-            mock_get_emb.return_value = mock_emb_service
-
-            mock_qdrant = MagicMock()
-            mock_qdrant_cls.return_value = mock_qdrant
-
-            from app.worker.tasks import update_product_embeddings  # noqa: PLC0415
+        # Create mock Category objects (not ProductCategory association objects)
+        mock_category_1 = MagicMock()
+        mock_category_1.id = 1
+        mock_category_1.name = "Tools"
+
+        mock_category_2 = MagicMock()
+        mock_category_2.id = 5
+        mock_category_2.name = "Hardware"
+
+        mock_product = MagicMock()
+        mock_product.sku = "TEST-002"
+        mock_product.name = "Power Drill"
+        mock_product.description = "A powerful drill"
+        mock_product.short_description = None
+        mock_product.price = 99.99
+        # product.categories returns Category objects directly
+        mock_product.categories = [mock_category_1, mock_category_2]
+        mock_session.execute.return_value.scalar_one_or_none.return_value = mock_product
+
+        mock_emb_service.get_product_text.return_value = "Power Drill. A powerful drill"
+        mock_emb_service.generate_embedding.return_value = [0.1] * 384
+
+        result = update_product_embeddings("TEST-002")
+
+        assert result["sku"] == "TEST-002"
+        assert result["status"] == "updated"
+
+        # Verify get_product_text was called with category names
+        mock_emb_service.get_product_text.assert_called_once()
+        call_kwargs = mock_emb_service.get_product_text.call_args
+        assert call_kwargs[1]["category_names"] == ["Tools", "Hardware"]
+
+        # Verify upsert_product was called with correct category IDs in payload
+        mock_qdrant.upsert_product.assert_called_once()
+        upsert_kwargs = mock_qdrant.upsert_product.call_args[1]
+        assert upsert_kwargs["payload"]["category_ids"] == [1, 5]
+
+    def test_update_embeddings_lookup_binds_each_call_sku(
+        self, sqlite_session, mock_emb_service, mock_qdrant
+    ):
+        """Test that the cached single-SKU statement binds the SKU of every call."""
+        sqlite_session.add_all([create_product(sku="SKU-001"), create_product(sku="SKU-002")])
+        sqlite_session.commit()
+
+        mock_emb_service.get_product_text.side_effect = lambda p, **_: p.name
+        mock_emb_service.generate_embedding.return_value = [0.1] * 384
+
+        update_product_embeddings("SKU-001")
+        update_product_embeddings("SKU-002")
+
+        upserted = [c.kwargs["sku"] for c in mock_qdrant.upsert_product.call_args_list]
+        assert upserted == ["SKU-001", "SKU-002"]
+
+    def test_update_all_embeddings_upserts_in_batch(
+        self, mock_session, mock_emb_service, mock_qdrant
+    ):
+        """Test that the update-all path sends products in one batched upsert."""
+        products = []
+        for sku in ("SKU-001", "SKU-002"):
+            product = MagicMock()
+            product.sku = sku
+            product.name = f"Product {sku}"
+            product.price = 10.0
+            product.categories = []
+            product.embedding_hash = None
+            products.append(product)
+        mock_session.execute.return_value.scalars.return_value.partitions.return_value = [
+            products
+        ]
+
+        mock_emb_service.get_product_text.side_effect = lambda p, **_: p.name
+        mock_emb_service.batch_embeddings.return_value = [[0.1] * 384, [0.2] * 384]
+
+        result = update_product_embeddings()
+
+        mock_emb_service.generate_embedding.assert_not_called()
+        mock_emb_service.batch_embeddings.assert_called_once()
+
+        assert result["status"] == "updated_all"
+        assert result["skus"] == ["SKU-001", "SKU-002"]
+        mock_qdrant.upsert_product.assert_not_called()
+        mock_qdrant.upsert_products_batch.assert_called_once()
+        points = mock_qdrant.upsert_products_batch.call_args.args[0]
+        assert [(sku, emb[0]) for sku, emb, _ in points] == [
+            ("SKU-001", 0.1),
+            ("SKU-002", 0.2),
+        ]
+
+
+class TestUpdateProductEmbeddingsBatchTask:
+    """Tests for update_product_embeddings_batch task."""
+
+    def test_update_embeddings_batch_embeds_requested_skus(
+        self, mock_session, mock_emb_service, mock_qdrant
+    ):
+        """Test that a SKU batch is embedded and upserted together."""
+        product = MagicMock()
+        product.sku = "SKU-001"
+        product.name = "Product"
+        product.price = 10.0
+        product.categories = []
+        product.embedding_hash = None
+        mock_session.execute.return_value.scalars.return_value.all.return_value = [product]
+
+        mock_emb_service.get_product_text.return_value = "Product"
+        mock_emb_service.batch_embeddings.return_value = [[0.1] * 384]
+
+        result = update_product_embeddings_batch(["SKU-001"])
+
+        assert result == {"status": "updated_batch", "count": 1, "skus": ["SKU-001"]}
+        mock_emb_service.batch_embeddings.assert_called_once()
+        mock_qdrant.upsert_products_batch.assert_called_once()
+        assert product.embedding_hash is not None
+
+    @pytest.fixture
+    def unchanged_product(self, mock_session, mock_emb_service, mock_qdrant) -> MagicMock:
+        """A product whose Qdrant point holds the hash of its current content."""
+        product = MagicMock()
+        product.sku = "SKU-001"
+        product.name = "Product"
+        product.price = 10.0
+        product.categories = []
+        product.embedding_hash = _embedding_hash(
+            "Product", {"name": "Product", "price": 10.0, "category_ids": []}
+        )
+        mock_qdrant.get_embedding_hashes.return_value = {"SKU-001": product.embedding_hash}
+        mock_session.execute.return_value.scalars.return_value.all.return_value = [product]
+        mock_emb_service.get_product_text.return_value = "Product"
+        mock_emb_service.batch_embeddings.return_value = [[0.1] * 384]
+        return product
+
+    def test_update_embeddings_batch_skips_unchanged_products(
+        self, unchanged_product, mock_emb_service, mock_qdrant
+    ):
+        """Test that products whose content hash is unchanged are not re-embedded."""
+        result = update_product_embeddings_batch(["SKU-001"])
+
+        assert result["count"] == 0
+        mock_emb_service.batch_embeddings.assert_not_called()
+        mock_qdrant.upsert_products_batch.assert_not_called()
+
+    def test_update_embeddings_batch_force_reembeds_unchanged_products(
+        self, unchanged_product, mock_emb_service, mock_qdrant
+    ):
+        """Test that force re-embeds products even when their hash is unchanged."""
+        result = update_product_embeddings_batch(["SKU-001"], force=True)
+
+        assert result["skus"] == ["SKU-001"]
+        mock_emb_service.batch_embeddings.assert_called_once()
+        mock_qdrant.upsert_products_batch.assert_called_once()
+        mock_qdrant.get_embedding_hashes.assert_not_called()
+
+    def test_update_embeddings_batch_reembeds_after_collection_recreated(
+        self, unchanged_product, mock_qdrant
+    ):
+        """Test that a batch re-embeds even when another task recreated the collection.
+
+        The product's database hash still matches, but the recreated collection
+        holds no point for it, so the vector must be rebuilt.
+        """
+        mock_qdrant.ensure_collection.return_value = False
+        mock_qdrant.get_embedding_hashes.return_value = {}
 
-            result = update_product_embeddings("TEST-002")
+        result = update_product_embeddings_batch(["SKU-001"])
 
-            assert result["sku"] == "TEST-002"
-            assert result["status"] == "updated"
+        assert result["skus"] == ["SKU-001"]
+        points = mock_qdrant.upsert_products_batch.call_args.args[0]
+        assert points[0][2]["embedding_hash"] == unchanged_product.embedding_hash
 
-            # Verify get_product_text was called with category names
-            mock_emb_service.get_product_text.assert_called_once()
-            call_kwargs = mock_emb_service.get_product_text.call_args
-            assert call_kwargs[1]["category_names"] == ["Tools", "Hardware"]
+    def test_embedding_hash_changes_with_model_and_vector_config(self):
+        """Test that stored hashes are invalidated by a different model or index config."""
+        payload = {"name": "Product", "price": 10.0, "category_ids": []}
+        current = _embedding_hash("Product", payload)
 
-            # Verify upsert_product was called with correct category IDs in payload
-            mock_qdrant.upsert_product.assert_called_once()
-            upsert_kwargs = mock_qdrant.upsert_product.call_args[1]
-            assert upsert_kwargs["payload"]["category_ids"] == [1, 5]
+        with patch("app.worker.tasks.EMBEDDING_INDEX_SIGNATURE", "other-model:384:Cosine:int8"):
+            assert _embedding_hash("Product", payload) != current
 
 
 class TestCleanupStaleVectorsTask:
     """Tests for cleanup_stale_vectors task."""
 
-    def test_cleanup_removes_vectors_for_deleted_products(self):
+    def test_cleanup_removes_vectors_for_deleted_products(self, mock_session, mock_qdrant):
         """Test that vectors for non-existent products are removed."""
-        with (
-            patch("app.worker.tasks.get_sync_db_session") as mock_get_db,
-            patch("app.worker.tasks.QdrantService") as mock_qdrant_cls,
-        ):
-            mock_session = MagicMock()
-            mock_get_db.return_value.__enter__ = MagicMock(return_value=mock_session)
-            mock_get_db.return_value.__exit__ = MagicMock(return_value=False)
-
-            # DB has SKU-001, Qdrant has SKU-001 and SKU-002
-            mock_session.execute.return_value.scalars.return_value.all.return_value = ["SKU-001"]
-
-            mock_qdrant = MagicMock()
-            mock_qdrant.get_all_skus.return_value = {"SKU-001", "SKU-002"}
-            mock_qdrant_cls.return_value = mock_qdrant
-
-            # Import inside patch context to use mocked dependencies
-            from app.worker.tasks import cleanup_stale_vectors  # noqa: PLC0415
+        # DB has SKU-001, Qdrant has SKU-001 and SKU-002
+        mock_session.execute.return_value.scalars.return_value.all.return_value = ["SKU-001"]
+        mock_qdrant.get_all_skus.return_value = {"SKU-001", "SKU-002"}
 
-            result = cleanup_stale_vectors()
+        result = cleanup_stale_vectors()
 
-            assert result["deleted"] == 1
-            assert "SKU-002" in result["deleted_skus"]
-            mock_qdrant.delete_product.assert_called_once_with("SKU-002")
+        assert result["deleted"] == 1
+        assert "SKU-002" in result["deleted_skus"]
+        mock_qdrant.delete_products_batch.assert_called_once_with({"SKU-002"})